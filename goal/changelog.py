@@ -1,21 +1,71 @@
 """Changelog management functions - extracted from cli.py."""
 
+import fnmatch
+import os
 import re
+import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Pattern, Tuple
 
+_GLOB_CHARS = frozenset("*?[")
 
-def _classify_file_domain(filepath: str, domain_mapping: Dict[str, str]) -> str:
-    """Return the domain label for a file based on domain_mapping patterns."""
-    import fnmatch
 
-    for pattern, domain in domain_mapping.items():
-        if fnmatch.fnmatch(filepath, pattern):
-            return domain
-        if pattern.endswith("/*") and filepath.startswith(pattern[:-2]):
-            return domain
-    return "other"
+class _DomainRules:
+    """domain_mapping compiled for repeated lookups; the first match wins.
+
+    Plain ``dir/*`` and ``dir/**`` patterns are prefix tests and live in a
+    dict probed once per distinct prefix length; ``*.ext`` patterns are a
+    dict keyed by extension. Other globs are translated to regexes once and
+    only tried while they precede the best dict hit.
+    """
+
+    def __init__(self, domain_mapping: Dict[str, str]):
+        self.prefixes: Dict[str, Tuple[int, str]] = {}
+        self.extensions: Dict[str, Tuple[int, str]] = {}
+        self.globs: List[Tuple[int, Optional[str], Pattern[str], str]] = []
+        for index, (pattern, domain) in enumerate(domain_mapping.items()):
+            if pattern.startswith("*.") and pattern[2:].isalnum():
+                self.extensions.setdefault(pattern[2:], (index, domain))
+                continue
+            # "dir/*" historically matches any path starting with "dir";
+            # "dir/**" is a plain glob covering everything under "dir/".
+            legacy = pattern[:-2] if pattern.endswith("/*") else None
+            prefix = pattern[:-2] if pattern.endswith("/**") else legacy
+            if prefix is not None and not _GLOB_CHARS.intersection(prefix):
+                self.prefixes.setdefault(prefix, (index, domain))
+                continue
+            regex = re.compile(fnmatch.translate(pattern))
+            self.globs.append((index, legacy, regex, domain))
+        self.lengths = sorted({len(prefix) for prefix in self.prefixes})
+
+    def classify(self, filepath: str) -> str:
+        """Return the domain label for a file, or ``"other"``."""
+        best, label = -1, "other"
+        _, dot, ext = filepath.rpartition(".")
+        if dot and ext in self.extensions:
+            best, label = self.extensions[ext]
+        for length in self.lengths:
+            hit = self.prefixes.get(filepath[:length])
+            if hit is not None and (best < 0 or hit[0] < best):
+                best, label = hit
+        for index, legacy, regex, domain in self.globs:
+            if 0 <= best < index:
+                break
+            if legacy is not None and filepath.startswith(legacy):
+                return domain
+            if regex.match(filepath):
+                return domain
+        return label
+
+
+# Changelog sections emitted for grouped entries, in output order.
+_SECTION_ORDER = {
+    domain: index
+    for index, domain in enumerate(
+        ["feat", "fix", "docs", "refactor", "test", "chore", "other"]
+    )
+}
 
 
 def _build_domain_entry(
@@ -23,20 +73,21 @@ def _build_domain_entry(
 ) -> str:
     """Build a changelog entry grouped by domain."""
     domain_mapping = config.get("git", {}).get("commit", {}).get("domain_mapping", {})
+    rules = _DomainRules(domain_mapping)
     domain_changes: Dict[str, List[str]] = {}
     for f in files:
         if not f:
             continue
-        domain = _classify_file_domain(f, domain_mapping)
+        domain = rules.classify(f)
         domain_changes.setdefault(domain, []).append(f)
 
     entry_lines = [f"## [{version}] - {date_str}\n"]
-    for domain in ["feat", "fix", "docs", "refactor", "test", "chore", "other"]:
-        if domain not in domain_changes:
-            continue
+    sections = sorted(
+        (d for d in domain_changes if d in _SECTION_ORDER), key=_SECTION_ORDER.get
+    )
+    for domain in sections:
         entry_lines.append(f"\n### {domain.capitalize()}\n")
-        for f in domain_changes[domain][:10]:
-            entry_lines.append(f"- Update {f}\n")
+        entry_lines.extend(f"- Update {f}\n" for f in domain_changes[domain][:10])
         overflow = len(domain_changes[domain]) - 10
         if overflow > 0:
             entry_lines.append(f"- ... and {overflow} more files\n")
@@ -45,24 +96,31 @@ def _build_domain_entry(
 
 def _build_simple_entry(version: str, date_str: str, files: List[str]) -> str:
     """Build a changelog entry without domain grouping."""
-    change_list = [f"- Update {f}" for f in files[:10]]
+    entry_lines = [f"## [{version}] - {date_str}\n\n### Changed\n"]
+    entry_lines.extend(f"- Update {f}\n" for f in files[:10])
     if len(files) > 10:
-        change_list.append(f"- ... and {len(files) - 10} more files")
-    return (
-        f"## [{version}] - {date_str}\n\n### Changed\n" + "\n".join(change_list) + "\n"
-    )
+        entry_lines.append(f"- ... and {len(files) - 10} more files\n")
+    return "".join(entry_lines)
+
+
+_UNRELEASED_MARKER = "## [Unreleased]"
+
+# Preamble of a freshly created CHANGELOG.md.
+_CHANGELOG_HEADER = (
+    "# Changelog\n\n"
+    "All notable changes to this project will be documented in this file.\n\n"
+    "The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),\n"
+    "and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).\n\n"
+)
+
+# Chunk size used when copying the untouched tail of CHANGELOG.md.
+_COPY_CHUNK = 1 << 20
 
 
 def _insert_entry(existing_content: str, entry: str) -> str:
     """Insert a version entry into existing changelog content."""
     if not existing_content:
-        return (
-            "# Changelog\n\n"
-            "All notable changes to this project will be documented in this file.\n\n"
-            "The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),\n"
-            "and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).\n\n"
-            f"## [Unreleased]\n\n{entry}\n"
-        )
+        return f"{_CHANGELOG_HEADER}{_UNRELEASED_MARKER}\n\n{entry}\n"
 
     pos = _find_unreleased_insert_pos(existing_content)
     if pos is not None:
@@ -82,7 +140,7 @@ def _find_unreleased_insert_pos(content: str) -> int | None:
 
     Returns the character offset, or None if no Unreleased section found.
     """
-    marker = "## [Unreleased]"
+    marker = _UNRELEASED_MARKER
     if marker not in content:
         return None
     after = content.split(marker, 1)[1]
@@ -111,7 +169,6 @@ def update_changelog(
         changelog_entry: Optional structured changelog entry from smart_commit.
     """
     changelog_path = Path("CHANGELOG.md")
-    existing_content = changelog_path.read_text() if changelog_path.exists() else ""
     date_str = datetime.now().strftime("%Y-%m-%d")
 
     use_domain_grouping = (
@@ -123,7 +180,39 @@ def update_changelog(
     else:
         entry = _build_simple_entry(version, date_str, files)
 
-    changelog_path.write_text(_insert_entry(existing_content, entry))
+    if changelog_path.exists():
+        _prepend_entry(changelog_path, entry)
+    else:
+        changelog_path.write_text(_insert_entry("", entry))
+
+
+def _prepend_entry(changelog_path: Path, entry: str) -> None:
+    """Insert entry into an existing changelog without reading all of it.
+
+    Lines are buffered only up to the first release heading after
+    ``## [Unreleased]``; the rest of the file is copied in chunks into a
+    sibling temp file that then atomically replaces the changelog. Files
+    without that layout are read whole and go through _insert_entry.
+    """
+    tmp = changelog_path.with_name(f".{changelog_path.name}.tmp")
+    try:
+        with open(changelog_path) as src, open(tmp, "w") as dst:
+            head: List[str] = []
+            in_unreleased = False
+            for line in src:
+                if in_unreleased and line.startswith("## "):
+                    dst.writelines(head)
+                    dst.write(f"{entry}\n{line}")
+                    shutil.copyfileobj(src, dst, _COPY_CHUNK)
+                    break
+                head.append(line)
+                in_unreleased = in_unreleased or _UNRELEASED_MARKER in line
+            else:
+                dst.write(_insert_entry("".join(head), entry))
+        shutil.copymode(changelog_path, tmp)
+        os.replace(tmp, changelog_path)
+    finally:
+        tmp.unlink(missing_ok=True)
 
 
 __all__ = ["update_changelog"]
@@ -3,13 +3,24 @@
 import click
 
 from goal.commit_generator import CommitMessageGenerator
-from goal.git_ops import get_staged_files, get_diff_stats
+from goal.git_ops import get_staged_files, get_diff_snapshot
 from goal.cli import main, apply_ticket_prefix
 from goal.authors.utils import (
     get_co_authors_from_command_line,
     add_co_authors_to_message,
 )
 
+_QualityValidator = None
+
+
+def _get_validator_cls():
+    """Import QualityValidator on first use; the summary package is heavy."""
+    global _QualityValidator
+
+    if _QualityValidator is None:
+        from goal.enhanced_summary import QualityValidator as _QualityValidator
+    return _QualityValidator
+
 
 def _output_detailed(title: str, body: str, use_markdown: bool) -> None:
     """Print a detailed commit message in markdown or plain style."""
@@ -100,10 +111,10 @@ def commit(ctx, detailed, unstaged, markdown, ticket, abstraction, co_author) ->
 @click.pass_context
 def fix_summary(ctx, fix, preview, cached):
     """Auto-fix commit summary quality issues."""
-    from ..enhanced_summary import QualityValidator
+    QualityValidator = _get_validator_cls()
 
-    files = get_staged_files()
-    stats = get_diff_stats()
+    snapshot = get_diff_snapshot()
+    files = snapshot.files
 
     if not files:
         click.echo(click.style("No changes to analyze.", fg="yellow"))
@@ -126,8 +137,8 @@ def fix_summary(ctx, fix, preview, cached):
         "body": detailed.get("body", ""),
         "intent": detailed.get("intent", ""),
         "metrics": {
-            "lines_added": sum(s[0] for s in stats.values()),
-            "lines_deleted": sum(s[1] for s in stats.values()),
+            "lines_added": snapshot.lines_added,
+            "lines_deleted": snapshot.lines_deleted,
         },
     }
 
@@ -160,9 +171,10 @@ def fix_summary(ctx, fix, preview, cached):
 @click.pass_context
 def validate(ctx, fix, cached):
     """Validate commit summary against quality gates."""
+    QualityValidator = _get_validator_cls()
 
-    files = get_staged_files()
-    stats = get_diff_stats()
+    snapshot = get_diff_snapshot()
+    files = snapshot.files
 
     if not files:
         click.echo(click.style("No changes to validate.", fg="yellow"))
@@ -185,8 +197,8 @@ def validate(ctx, fix, cached):
         "body": detailed.get("body", ""),
         "intent": detailed.get("intent", ""),
         "metrics": {
-            "lines_added": sum(s[0] for s in stats.values()),
-            "lines_deleted": sum(s[1] for s in stats.values()),
+            "lines_added": snapshot.lines_added,
+            "lines_deleted": snapshot.lines_deleted,
         },
     }
 
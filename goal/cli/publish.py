@@ -1,5 +1,9 @@
 """Publishing functions - extracted from cli.py."""
 
+import os
+import re
+import shlex
+import stat
 import subprocess
 import time
 from pathlib import Path
@@ -13,18 +17,29 @@ from goal.cli.version import PROJECT_TYPES
 from goal.toml_validation import validate_project_toml_files
 
 
+def _is_file(path: Path) -> bool:
+    """``path.exists() and path.is_file()`` in a single stat() call."""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
 def makefile_has_target(target: str) -> bool:
-    """Check if Makefile has a specific target."""
+    """Check if Makefile has a specific target.
+
+    The Makefile is streamed line by line and the scan stops at the first
+    rule for target, so the rest of a large Makefile is never read.
+    """
     makefile = Path("Makefile")
-    if not makefile.exists() or not makefile.is_file():
+    if not _is_file(makefile):
         return False
+    rule = re.compile(rf"\s*{re.escape(target)}\s*:")
     try:
-        content = makefile.read_text(errors="ignore")
+        with open(makefile, errors="ignore") as fh:
+            return any(target in line and rule.match(line) for line in fh)
     except Exception:
         return False
-    import re
-
-    return re.search(rf"^\s*{re.escape(target)}\s*:", content, re.MULTILINE) is not None
 
 
 def _get_project_strategy(config: Any, project_type: str) -> dict:
@@ -87,7 +102,7 @@ def _get_python_bin() -> str:
     # Check for venv in current directory (priority order: .venv, venv, env)
     for venv_name in [".venv", "venv", "env"]:
         venv_python = Path(".") / venv_name / "bin" / "python"
-        if venv_python.exists():
+        if _is_file(venv_python):
             return str(venv_python.resolve())
     # Fall back to sys.executable
     import sys
@@ -95,38 +110,48 @@ def _get_python_bin() -> str:
     return sys.executable
 
 
-def _ensure_publish_deps(python_bin: str) -> bool:
-    """Ensure build and twine are installed for publishing."""
-    # Check if build is available
-    result = subprocess.run(
-        [python_bin, "-m", "build", "--help"], capture_output=True, text=True
-    )
-    if result.returncode != 0:
-        click.echo(click.style("  Installing build module...", fg="cyan"))
-        install_result = subprocess.run(
-            [python_bin, "-m", "pip", "install", "--quiet", "build"],
-            capture_output=True,
-            text=True,
-            cwd=str(Path(".")),
-        )
-        if install_result.returncode != 0:
-            click.echo(
-                click.style(
-                    f"  ✗ Failed to install build module: {install_result.stderr}",
-                    fg="red",
-                )
-            )
-            return False
-        click.echo(click.style("  ✓ build installed", fg="green"))
+# Modules the Python publish path runs as ``python -m <module>``, with the
+# label used in install messages.
+_PUBLISH_MODULES = {"build": "build module", "twine": "twine"}
+
+# Find every requested module from one interpreter start; prints the misses.
+# ``-c`` puts the cwd on sys.path, where a leftover ``build/`` directory would
+# resolve as a namespace package; drop it and treat origin-less specs as
+# missing so the result matches what ``python -m <module>`` can run.
+_FIND_SPEC_PROBE = (
+    "import importlib.util, sys\n"
+    "sys.path[:] = [p for p in sys.path if p]\n"
+    "for m in sys.argv[1:]:\n"
+    "    spec = importlib.util.find_spec(m)\n"
+    "    if spec is None or spec.origin is None: print(m)"
+)
+
+# Interpreters already known to have every publish module.
+_publish_ready: set = set()
 
-    # Check if twine is available
+
+def _missing_modules(python_bin: str, modules: List[str]) -> List[str]:
+    """Return the modules python_bin cannot import, probed in one subprocess."""
     result = subprocess.run(
-        [python_bin, "-m", "twine", "--help"], capture_output=True, text=True
+        [python_bin, "-c", _FIND_SPEC_PROBE, *modules],
+        capture_output=True,
+        text=True,
     )
     if result.returncode != 0:
-        click.echo(click.style("  Installing twine...", fg="cyan"))
+        return list(modules)
+    return result.stdout.split()
+
+
+def _ensure_publish_deps(python_bin: str) -> bool:
+    """Ensure build and twine are installed for publishing."""
+    if python_bin in _publish_ready:
+        return True
+
+    for module in _missing_modules(python_bin, list(_PUBLISH_MODULES)):
+        label = _PUBLISH_MODULES.get(module, module)
+        click.echo(click.style(f"  Installing {label}...", fg="cyan"))
         install_result = subprocess.run(
-            [python_bin, "-m", "pip", "install", "--quiet", "twine"],
+            [python_bin, "-m", "pip", "install", "--quiet", module],
             capture_output=True,
             text=True,
             cwd=str(Path(".")),
@@ -134,12 +159,14 @@ def _ensure_publish_deps(python_bin: str) -> bool:
         if install_result.returncode != 0:
             click.echo(
                 click.style(
-                    f"  ✗ Failed to install twine: {install_result.stderr}", fg="red"
+                    f"  ✗ Failed to install {label}: {install_result.stderr}",
+                    fg="red",
                 )
             )
             return False
-        click.echo(click.style("  ✓ twine installed", fg="green"))
+        click.echo(click.style(f"  ✓ {module} installed", fg="green"))
 
+    _publish_ready.add(python_bin)
     return True
 
 
@@ -150,10 +177,16 @@ def _prepare_python_publish(strategy: dict) -> tuple:
     if not _ensure_publish_deps(python_bin):
         return "", False
 
-    build_cmd = strategy.get("build", "") or "python -m build"
+    # A configured build step may use shell syntax; the default is run as
+    # argv, so no shell is spawned and python_bin needs no quoting.
+    build_cmd = strategy.get("build", "") or [python_bin, "-m", "build"]
     if build_cmd:
-        build_cmd = build_cmd.replace("python ", f"{python_bin} ")
-        click.echo(click.style(f"  Build command: {build_cmd}", fg="cyan"))
+        if isinstance(build_cmd, str):
+            build_cmd = build_cmd.replace("python ", f"{python_bin} ")
+            shown = build_cmd
+        else:
+            shown = shlex.join(build_cmd)
+        click.echo(click.style(f"  Build command: {shown}", fg="cyan"))
         build_result = run_command_tee(build_cmd)
         if build_result.returncode != 0:
             click.echo(
@@ -178,6 +211,10 @@ def _prepare_python_publish(strategy: dict) -> tuple:
 
 _RETRY_DELAYS = [60, 120, 300]
 
+# Registry refusal for an already-uploaded artifact ("File already exists"),
+# matched in one case-insensitive pass over the combined output.
+_FILE_EXISTS_RE = re.compile(r"file[^a-z0-9]+already[^a-z0-9]+exists", re.IGNORECASE)
+
 
 def _is_rate_limited(result) -> bool:
     """Check if a publish result indicates PyPI rate limiting (HTTP 429)."""
@@ -202,7 +239,7 @@ def _run_publish_command(ptype: str, publish_cmd: str) -> bool:
                 )
                 return True
             combined_output = f"{result.stdout or ''}\n{result.stderr or ''}"
-            if "File already exists" in combined_output:
+            if _FILE_EXISTS_RE.search(combined_output):
                 click.echo(
                     click.style(
                         "  ⚠  Artifact already exists on registry; skipping upload.",
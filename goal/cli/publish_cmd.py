@@ -1,5 +1,6 @@
 """Publish command - extracted from cli.py."""
 
+import shlex
 import shutil
 
 import click
@@ -20,8 +21,10 @@ def _publish_impl(ctx_obj, use_make, target, version_arg) -> None:
     config = ctx_obj.get("config")
 
     if use_make and shutil.which("make") and makefile_has_target(target):
-        cmd = f"make {target}"
-        click.echo(f"\n{click.style('Publishing:', fg='cyan', bold=True)} {cmd}")
+        cmd = ["make", target]
+        click.echo(
+            f"\n{click.style('Publishing:', fg='cyan', bold=True)} {shlex.join(cmd)}"
+        )
         result = run_command_tee(cmd)
         if result.returncode != 0:
             click.echo(
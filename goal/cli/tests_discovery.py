@@ -2,7 +2,7 @@
 
 import shutil
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from goal.cli.version import PROJECT_TYPES
 
@@ -38,32 +38,53 @@ def _has_project_marker(project_dir: Path, marker: str) -> bool:
     return (project_dir / marker).exists()
 
 
-def _find_project_root(path: Path, project_type: str) -> Optional[Path]:
-    """Find the nearest ancestor that looks like a project root."""
+def _find_project_root(
+    path: Path,
+    project_type: str,
+    memo: Optional[Dict[Path, Optional[Path]]] = None,
+) -> Optional[Path]:
+    """Find the nearest ancestor that looks like a project root.
+
+    ``memo`` maps already-walked directories to their root, so sibling test
+    files sharing ancestors probe each directory's markers only once.
+    """
     markers = PROJECT_TYPES.get(project_type, {}).get("files", [])
     current = path
+    walked: List[Path] = []
+    root: Optional[Path] = None
 
     while True:
+        if memo is not None and current in memo:
+            root = memo[current]
+            break
+
+        walked.append(current)
         if any(_has_project_marker(current, marker) for marker in markers):
-            return current
+            root = current
+            break
 
         if current.parent == current:
-            return None
+            break
 
         current = current.parent
 
+    if memo is not None:
+        memo.update(dict.fromkeys(walked, root))
+    return root
+
 
 def find_python_test_dirs() -> List[str]:
     """Find Python subproject test targets (tests/ dir preferred, otherwise project root)."""
     cwd = Path(".").resolve()
     seen_roots: set[str] = set()
     project_roots: List[Path] = []
+    roots_by_dir: Dict[Path, Optional[Path]] = {}
 
     for test_file in Path(".").rglob("test_*.py"):
         if set(test_file.parts) & _SKIP_DIRS:
             continue
 
-        project_root = _find_project_root(test_file.parent, "python")
+        project_root = _find_project_root(test_file.parent, "python", roots_by_dir)
         if project_root is None:
             continue
 
@@ -7,11 +7,11 @@ from goal.git_ops import (
     get_remote_branch,
     get_staged_files,
     get_unstaged_files,
-    run_git,
     ensure_git_repository,
     validate_repo_url,
     clone_repository,
 )
+from goal.cli_helpers import stage_paths
 from goal.formatter import format_status_output
 from goal.config import init_config
 from goal.user_config import get_user_config, initialize_user_config
@@ -125,9 +125,8 @@ def version(bump_type):
     )
     click.echo(f"Updated files: {', '.join(updated)}")
 
-    # Stage the changes
-    for f in updated:
-        run_git("add", f)
+    # Stage the changes in one batched git add
+    stage_paths(updated)
 
     click.echo(
         click.style("✓ Version changes staged. Run 'goal push' to commit.", fg="cyan")
@@ -1,8 +1,10 @@
 """Version management - version synchronization functions."""
 
+import fnmatch
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, List, Tuple
 
 try:
     import tomlkit
@@ -10,16 +12,58 @@ except ImportError:
     tomlkit = None
 
 from .version_utils import (
+    _list_cwd,
+    _read_text_cached,
+    clear_project_cache,
     update_json_version,
     update_project_metadata,
     update_readme_metadata,
 )
 from goal.version_validation import update_badge_versions
 
+_PYPROJECT_VERSION_RE = re.compile(
+    r'^(version\s*=\s*["\'])\d+\.\d+\.\d+(["\'])', re.MULTILINE
+)
+_CARGO_VERSION_RE = re.compile(r'^(version\s*=\s*")\d+\.\d+\.\d+(")', re.MULTILINE)
+_CSPROJ_VERSION_RE = re.compile(r"<Version>\d+\.\d+\.\d+</Version>")
+_POM_VERSION_RE = re.compile(r"(<version>)\d+\.\d+\.\d+(</version>)")
+_INIT_VERSION_RE = re.compile(
+    r'^(__version__\s*=\s*["\'])\d+\.\d+\.\d+(["\'])', re.MULTILINE
+)
+
+
+def _sub_version_line(
+    content: str, prefix: str, regex: "re.Pattern[str]", repl: str
+) -> str:
+    """Equivalent of ``regex.sub(repl, content, count=1)`` for a line-anchored
+    ``regex`` whose matches start with ``prefix``.
+
+    Only lines beginning with ``prefix`` are handed to the regex, and the
+    replacement is spliced in, so the ``^`` scan never walks the file.
+    """
+    needle = "\n" + prefix
+    pos = 0 if content.startswith(prefix) else content.find(needle) + 1 or -1
+    while pos != -1:
+        end = content.find("\n", pos)
+        if end == -1:
+            end = len(content)
+        line, count = regex.subn(repl, content[pos:end], count=1)
+        if count:
+            return content[:pos] + line + content[end:]
+        pos = content.find(needle, end) + 1 or -1
+    return content
+
 
 def _update_version_file(new_version: str, updated: List[str]) -> None:
     """Update VERSION file."""
-    Path("VERSION").write_text(f"{new_version}\n")
+    path = Path("VERSION")
+    content = f"{new_version}\n"
+    try:
+        unchanged = path.read_bytes() == content.encode()
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        path.write_text(content)
     updated.append("VERSION")
 
 
@@ -28,12 +72,11 @@ def _update_json_version_file(
 ) -> None:
     """Update JSON version file (package.json, composer.json)."""
     path = Path(filename)
-    if path.exists():
-        if update_json_version(path, new_version):
+    if update_json_version(path, new_version):
+        updated.append(filename)
+    if user_config and update_project_metadata(path, user_config):
+        if filename not in updated:
             updated.append(filename)
-        if user_config and update_project_metadata(path, user_config):
-            if filename not in updated:
-                updated.append(filename)
 
 
 def _update_toml_version(
@@ -41,11 +84,8 @@ def _update_toml_version(
 ) -> None:
     """Update TOML version file (pyproject.toml)."""
     path = Path(filename)
-    if not path.exists():
-        return
-
     try:
-        content = path.read_text()
+        content = _read_text_cached(path)
         # Use tomlkit to preserve formatting and structure
         if tomlkit is not None:
             doc = tomlkit.parse(content)
@@ -56,12 +96,8 @@ def _update_toml_version(
                     updated.append(filename)
         else:
             # Fallback to regex if tomlkit not available
-            new_content = re.sub(
-                r'^(version\s*=\s*["\'])\d+\.\d+\.\d+(["\'])',
-                rf"\g<1>{new_version}\g<2>",
-                content,
-                count=1,
-                flags=re.MULTILINE,
+            new_content = _sub_version_line(
+                content, "version", _PYPROJECT_VERSION_RE, rf"\g<1>{new_version}\g<2>"
             )
             if new_content != content:
                 path.write_text(new_content)
@@ -69,13 +105,9 @@ def _update_toml_version(
     except Exception:
         # Fallback to regex on any error
         try:
-            content = path.read_text()
-            new_content = re.sub(
-                r'^(version\s*=\s*["\'])\d+\.\d+\.\d+(["\'])',
-                rf"\g<1>{new_version}\g<2>",
-                content,
-                count=1,
-                flags=re.MULTILINE,
+            content = _read_text_cached(path)
+            new_content = _sub_version_line(
+                content, "version", _PYPROJECT_VERSION_RE, rf"\g<1>{new_version}\g<2>"
             )
             if new_content != content:
                 path.write_text(new_content)
@@ -93,52 +125,42 @@ def _update_cargo_version(
 ) -> None:
     """Update Cargo.toml version."""
     path = Path(filename)
-    if path.exists():
-        content = path.read_text()
-        new_content = re.sub(
-            r'^(version\s*=\s*")\d+\.\d+\.\d+(")',
-            rf"\g<1>{new_version}\g<2>",
-            content,
-            count=1,
-            flags=re.MULTILINE,
-        )
-        if new_content != content:
-            path.write_text(new_content)
+    content = _read_text_cached(path)
+    new_content = _sub_version_line(
+        content, "version", _CARGO_VERSION_RE, rf"\g<1>{new_version}\g<2>"
+    )
+    if new_content != content:
+        path.write_text(new_content)
+        updated.append(filename)
+    if user_config and update_project_metadata(path, user_config):
+        if filename not in updated:
             updated.append(filename)
-        if user_config and update_project_metadata(path, user_config):
-            if filename not in updated:
-                updated.append(filename)
 
 
-def _update_csproj_versions(new_version: str, updated: List[str]) -> None:
-    """Update all .csproj files."""
-    for csproj in Path(".").glob("*.csproj"):
-        content = csproj.read_text()
-        new_content = re.sub(
-            r"<Version>\d+\.\d+\.\d+</Version>",
-            f"<Version>{new_version}</Version>",
-            content,
-            count=1,
-        )
-        if new_content != content:
-            csproj.write_text(new_content)
-            updated.append(str(csproj))
+def _update_csproj_version(
+    filename: str, new_version: str, user_config, updated: List[str]
+) -> None:
+    """Update a .csproj file."""
+    path = Path(filename)
+    content = path.read_text()
+    new_content = _CSPROJ_VERSION_RE.sub(
+        f"<Version>{new_version}</Version>", content, count=1
+    )
+    if new_content != content:
+        path.write_text(new_content)
+        updated.append(filename)
 
 
-def _update_pom_xml(new_version: str, updated: List[str]) -> None:
+def _update_pom_xml(
+    filename: str, new_version: str, user_config, updated: List[str]
+) -> None:
     """Update pom.xml version."""
-    pom_path = Path("pom.xml")
-    if pom_path.exists():
-        content = pom_path.read_text()
-        new_content = re.sub(
-            r"(<version>)\d+\.\d+\.\d+(</version>)",
-            rf"\g<1>{new_version}\g<2>",
-            content,
-            count=1,
-        )
-        if new_content != content:
-            pom_path.write_text(new_content)
-            updated.append("pom.xml")
+    path = Path(filename)
+    content = path.read_text()
+    new_content = _POM_VERSION_RE.sub(rf"\g<1>{new_version}\g<2>", content, count=1)
+    if new_content != content:
+        path.write_text(new_content)
+        updated.append(filename)
 
 
 def _update_readme_metadata(user_config, new_version: str, updated: List[str]) -> None:
@@ -172,13 +194,13 @@ def _update_init_py_versions(new_version: str, updated: List[str]) -> None:
         if any(p in parts for p in skip_dirs) or ".egg-info" in str(init_file):
             continue
         try:
-            content = init_file.read_text()
-            new_content = re.sub(
-                r'^(__version__\s*=\s*["\'])\d+\.\d+\.\d+(["\'])',
-                rf"\g<1>{new_version}\g<2>",
-                content,
-                count=1,
-                flags=re.MULTILINE,
+            data = init_file.read_bytes()
+            # Most packages have no __version__ at all; skip decode and regex.
+            if b"__version__" not in data:
+                continue
+            content = data.decode("utf-8")
+            new_content = _sub_version_line(
+                content, "__version__", _INIT_VERSION_RE, rf"\g<1>{new_version}\g<2>"
             )
             if new_content != content:
                 init_file.write_text(new_content)
@@ -187,18 +209,60 @@ def _update_init_py_versions(new_version: str, updated: List[str]) -> None:
             pass
 
 
+# Top-level version files, in update order. Globs are matched against the
+# directory listing; every updater takes (filename, new_version,
+# user_config, updated).
+_Updater = Callable[[str, str, Any, List[str]], None]
+_VERSION_UPDATERS: Tuple[Tuple[str, _Updater], ...] = (
+    ("package.json", _update_json_version_file),
+    ("composer.json", _update_json_version_file),
+    ("pyproject.toml", _update_toml_version),
+    ("Cargo.toml", _update_cargo_version),
+    ("*.csproj", _update_csproj_version),
+    ("pom.xml", _update_pom_xml),
+)
+
+
+def _run_updaters(
+    tasks: List[Tuple[str, _Updater]], new_version: str, user_config
+) -> List[str]:
+    """Run per-file updaters concurrently; results keep ``tasks`` order.
+
+    Each task touches a different file, so the reads and writes overlap
+    safely; every updater records into its own list.
+    """
+
+    def run(task: Tuple[str, _Updater]) -> List[str]:
+        filename, updater = task
+        changed: List[str] = []
+        updater(filename, new_version, user_config, changed)
+        return changed
+
+    if len(tasks) <= 1:
+        results = map(run, tasks)
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as pool:
+            results = list(pool.map(run, tasks))
+    return [filename for changed in results for filename in changed]
+
+
 def sync_all_versions(new_version: str, user_config=None) -> List[str]:
     """Update version, author, and license in all detected project files."""
     updated: List[str] = []
 
     _update_version_file(new_version, updated)
-    _update_json_version_file("package.json", new_version, user_config, updated)
-    _update_json_version_file("composer.json", new_version, user_config, updated)
-    _update_toml_version("pyproject.toml", new_version, user_config, updated)
-    _update_cargo_version("Cargo.toml", new_version, user_config, updated)
-    _update_csproj_versions(new_version, updated)
-    _update_pom_xml(new_version, updated)
+    name_set, names = _list_cwd()
+    tasks: List[Tuple[str, _Updater]] = []
+    for file_pattern, updater in _VERSION_UPDATERS:
+        if "*" in file_pattern:
+            matches = fnmatch.filter(names, file_pattern)
+            tasks.extend((name, updater) for name in matches)
+        elif file_pattern in name_set:
+            tasks.append((file_pattern, updater))
+    updated.extend(_run_updaters(tasks, new_version, user_config))
     _update_readme_metadata(user_config, new_version, updated)
     _update_init_py_versions(new_version, updated)
 
+    if updated:
+        clear_project_cache()
     return updated
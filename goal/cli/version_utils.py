@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import fnmatch
+import os
 import re
 import json
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from typing import Optional, List, Dict, Any, Tuple, Union, TYPE_CHECKING
 
 try:
     import tomlkit
@@ -19,40 +23,156 @@ else:
 
 from .version_types import PROJECT_TYPES
 
+# Compiled once per pattern string; PROJECT_TYPES keeps the plain strings
+# so user-facing configs and update_version_in_file can still work on them.
+_VERSION_RES: Dict[str, "re.Pattern[str]"] = {
+    pattern: re.compile(pattern, re.MULTILINE)
+    for config in PROJECT_TYPES.values()
+    for pattern in config.get("version_patterns", {}).values()
+}
 
-def detect_project_types() -> List[str]:
-    """Detect what type(s) of project this is."""
+_SEMVER_GROUP = r"(\d+\.\d+\.\d+)"
+_SEMVER_RE = re.compile(r"\d+\.\d+\.\d+")
+_JSON_VERSION_FILES = frozenset({"package.json", "composer.json"})
+_PRERELEASE_SPLIT_RE = re.compile(r"[-+]|(?<=\d)(?=[a-zA-Z])")
+_PRERELEASE_TAIL_RE = re.compile(r"\.(dev|post|a|b|rc|alpha|beta)\d*$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=32)
+def _read_text_at(path: str, mtime_ns: int, size: int) -> str:
+    return Path(path).read_text()
+
+
+# Files modified this recently are read uncached: a second same-size write
+# within one timestamp tick would not change the (mtime, size) key.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _read_text_cached(filepath: Path) -> str:
+    """``filepath.read_text()``, reused while the file's mtime and size hold.
+
+    Release flows read the same manifests several times (current version,
+    then sync and metadata updates); a rewrite changes the key.
+    """
+    st = os.stat(filepath)
+    if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+        return filepath.read_text()
+    return _read_text_at(os.path.abspath(filepath), st.st_mtime_ns, st.st_size)
+
+
+def _version_re(pattern: Union[str, "re.Pattern[str]"]) -> "re.Pattern[str]":
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    compiled = _VERSION_RES.get(pattern)
+    if compiled is None:
+        compiled = _VERSION_RES[pattern] = re.compile(pattern, re.MULTILINE)
+    return compiled
+
+
+@lru_cache(maxsize=32)
+def _version_update_re(pattern: str, old_version: str) -> "re.Pattern[str]":
+    return re.compile(pattern.replace(_SEMVER_GROUP, old_version), re.MULTILINE)
+
+
+def _cwd_key() -> Tuple[str, int]:
+    """Cache key for the current directory listing.
+
+    A directory's mtime changes whenever an entry is created, removed or
+    renamed in it, which is all that project detection depends on.
+    """
+    cwd = os.getcwd()
+    try:
+        return cwd, os.stat(cwd).st_mtime_ns
+    except OSError:
+        return cwd, -1
+
+
+def _list_cwd() -> Tuple[frozenset, List[str]]:
+    """Names in the current directory from one ``os.scandir`` pass."""
+    try:
+        with os.scandir(".") as it:
+            names = [entry.name for entry in it]
+    except OSError:
+        names = []
+    return frozenset(names), names
+
+
+@lru_cache(maxsize=4)
+def _detect_project_types(cwd: str, mtime_ns: int) -> Tuple[str, ...]:
+    name_set, names = _list_cwd()
     detected = []
     for ptype, config in PROJECT_TYPES.items():
         for file_pattern in config["files"]:
             if "*" in file_pattern:
-                if list(Path(".").glob(file_pattern)):
+                if fnmatch.filter(names, file_pattern):
                     detected.append(ptype)
                     break
-            elif Path(file_pattern).exists():
+            elif file_pattern in name_set:
                 detected.append(ptype)
                 break
-    return detected
+    return tuple(detected)
 
 
-def find_version_files() -> Dict[str, Path]:
-    """Find all version-containing files in the project."""
+@lru_cache(maxsize=4)
+def _find_version_files(cwd: str, mtime_ns: int) -> Tuple[Tuple[str, Path, str], ...]:
+    name_set, names = _list_cwd()
     found = {}
     for ptype, config in PROJECT_TYPES.items():
         for file_pattern, pattern in config.get("version_patterns", {}).items():
             if "*" in file_pattern:
-                for f in Path(".").glob(file_pattern):
-                    found[str(f)] = (f, pattern)
-            elif Path(file_pattern).exists():
+                for name in fnmatch.filter(names, file_pattern):
+                    found[name] = (Path(name), pattern)
+            elif file_pattern in name_set:
                 found[file_pattern] = (Path(file_pattern), pattern)
-    return found
+    return tuple((name, path, pattern) for name, (path, pattern) in found.items())
+
+
+def detect_project_types() -> List[str]:
+    """Detect what type(s) of project this is.
 
+    Results are reused while the working directory and its listing are
+    unchanged.
+    """
+    return list(_detect_project_types(*_cwd_key()))
+
+
+def find_version_files() -> Dict[str, Path]:
+    """Find all version-containing files in the project."""
+    return {
+        name: (path, pattern)
+        for name, path, pattern in _find_version_files(*_cwd_key())
+    }
 
-def get_version_from_file(filepath: Path, pattern: str) -> Optional[str]:
-    """Extract version from a file using regex pattern."""
+
+def clear_project_cache() -> None:
+    """Forget cached project detection, e.g. after files were written."""
+    _detect_project_types.cache_clear()
+    _find_version_files.cache_clear()
+    _read_text_at.cache_clear()
+
+
+def get_version_from_file(
+    filepath: Path, pattern: Union[str, "re.Pattern[str]"]
+) -> Optional[str]:
+    """Extract version from a file using regex pattern.
+
+    ``package.json`` and ``composer.json`` are parsed with :mod:`json` and
+    their top-level ``version`` is used; the regex is only a fallback for
+    files that are not valid JSON.
+    """
     try:
-        content = filepath.read_text()
-        match = re.search(pattern, content, re.MULTILINE)
+        content = _read_text_cached(filepath)
+        if filepath.name in _JSON_VERSION_FILES:
+            try:
+                data = json.loads(content)
+            except ValueError:
+                pass
+            else:
+                version = data.get("version") if isinstance(data, dict) else None
+                if isinstance(version, str) and _SEMVER_RE.fullmatch(version):
+                    return version
+                return None
+        match = _version_re(pattern).search(content)
         if match:
             return match.group(1)
     except Exception:
@@ -91,9 +211,9 @@ def bump_version(version: str, bump_type: str) -> str:
     # Strip any pre-release / build suffix before numeric parsing.
     # Matches an optional hyphen or dot followed by non-numeric tail, e.g.
     # "0.2.0-rc1", "1.0.0rc1", "2024.1.0.dev3", "1.2.3.post1"
-    base = re.split(r"[-+]|(?<=\d)(?=[a-zA-Z])", version)[0]
+    base = _PRERELEASE_SPLIT_RE.split(version)[0]
     # Remove any trailing dot-separated non-numeric segment (e.g. ".dev1", ".post1")
-    base = re.sub(r"\.(dev|post|a|b|rc|alpha|beta)\d*$", "", base, flags=re.IGNORECASE)
+    base = _PRERELEASE_TAIL_RE.sub("", base)
 
     parts = base.split(".")
     if len(parts) < 3:
@@ -120,12 +240,10 @@ def update_version_in_file(
     try:
         content = filepath.read_text()
         # Create replacement pattern
-        new_content = re.sub(
-            pattern.replace(r"(\d+\.\d+\.\d+)", old_version),
+        new_content = _version_update_re(pattern, old_version).sub(
             lambda m: m.group(0).replace(old_version, new_version),
             content,
             count=1,
-            flags=re.MULTILINE,
         )
         if new_content != content:
             filepath.write_text(new_content)
@@ -138,8 +256,8 @@ def update_version_in_file(
 def update_json_version(filepath: Path, new_version: str) -> bool:
     """Update version in JSON files (package.json, composer.json)."""
     try:
-        content = json.loads(filepath.read_text())
-        if "version" in content:
+        content = json.loads(_read_text_cached(filepath))
+        if "version" in content and content["version"] != new_version:
             content["version"] = new_version
             filepath.write_text(f"{json.dumps(content, indent=2)}\n")
             return True
@@ -382,7 +500,7 @@ def update_project_metadata(filepath: Path, user_config) -> bool:
         if not all([author_name, author_email, license_id]):
             return False
 
-        content = filepath.read_text()
+        content = _read_text_cached(filepath)
         original_content = content
 
         if filepath.name == "pyproject.toml":
@@ -1,9 +1,10 @@
 """Shared CLI helpers - extracted to avoid circular imports."""
 
-import os
 import re
 from typing import List, Dict
 
+import click
+
 from goal.git_ops import run_git
 
 
@@ -18,6 +19,17 @@ def strip_ansi(text: str) -> str:
         return text
 
 
+# One anchored alternation per group, tried in priority order; the first
+# branch that matches names the group (``re`` keeps alternation order).
+_PATH_GROUP_RE = re.compile(
+    r"(?:(?P<examples>examples/)"
+    r"|(?P<docs>docs/|.*\.(?:md|rst)\Z)"
+    r"|(?P<ci>\.github/|\.gitlab/|.*\.ya?ml\Z)"
+    r"|(?P<code>src/|lib/|.*\.py\Z))",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
 def split_paths_by_type(paths: List[str]) -> Dict[str, List[str]]:
     """Split file paths into groups (code/docs/ci/examples/other)."""
     groups: Dict[str, List[str]] = {
@@ -27,56 +39,50 @@ def split_paths_by_type(paths: List[str]) -> Dict[str, List[str]]:
         "examples": [],
         "other": [],
     }
+    match = _PATH_GROUP_RE.match
     for p in paths:
-        pl = p.lower()
-        if pl.startswith("examples/"):
-            groups["examples"].append(p)
-        elif (
-            pl.startswith("docs/")
-            or pl.endswith((".md", ".rst"))
-            or os.path.basename(pl) in ("readme.md",)
-        ):
-            groups["docs"].append(p)
-        elif (
-            pl.startswith(".github/")
-            or pl.startswith(".gitlab/")
-            or pl.endswith((".yml", ".yaml"))
-        ):
-            groups["ci"].append(p)
-        elif pl.startswith("src/") or pl.startswith("lib/") or pl.endswith(".py"):
-            groups["code"].append(p)
-        else:
-            groups["other"].append(p)
+        m = match(p)
+        groups[m.lastgroup if m else "other"].append(p)
 
     return {k: v for k, v in groups.items() if v}
 
 
+# Characters of pathspec passed to one ``git add``; stays well inside the
+# smallest command-line limit (32767 on Windows).
+_STAGE_ARGV_BUDGET = 30_000
+
+
 def stage_paths(paths: List[str]) -> None:
-    """Stage file paths in git."""
-    if not paths:
-        return
-    # stage in chunks to avoid arg length issues
+    """Stage file paths in git.
+
+    Paths are batched by command-line length rather than count, so a large
+    change set costs a few ``git add`` runs instead of one per 100 paths.
+    """
     chunk: List[str] = []
+    size = 0
     for p in paths:
-        chunk.append(p)
-        if len(chunk) >= 100:
+        if chunk and size + len(p) + 1 > _STAGE_ARGV_BUDGET:
             run_git("add", "--", *chunk)
-            chunk = []
+            chunk, size = [], 0
+        chunk.append(p)
+        size += len(p) + 1
     if chunk:
         run_git("add", "--", *chunk)
 
 
+_CONFIRM_RETRY = click.style("Please respond with 'y' or 'n'", fg="red")
+
+
 def confirm(prompt: str, default: bool = True) -> bool:
     """Ask for user confirmation with Y/n prompt (Enter defaults to Yes)."""
-    import click
-
     if default:
         suffix = " [Y/n] "
     else:
         suffix = " [y/N] "
 
+    styled_prompt = f"{click.style(prompt, fg='cyan')}{suffix}"
     while True:
-        response = input(f"{click.style(prompt, fg='cyan')}{suffix}").strip().lower()
+        response = input(styled_prompt).strip().lower()
 
         if not response:
             return default
@@ -86,7 +92,7 @@ def confirm(prompt: str, default: bool = True) -> bool:
         elif response in ["n", "no"]:
             return False
         else:
-            click.echo(click.style("Please respond with 'y' or 'n'", fg="red"))
+            click.echo(_CONFIRM_RETRY)
 
 
 __all__ = [
@@ -1,5 +1,6 @@
 """Python project diagnostics — extended checks (PY010–PY014)."""
 
+import os
 import re
 from pathlib import Path
 from typing import List, Optional
@@ -7,6 +8,13 @@ from typing import List, Optional
 from goal.doctor.models import Issue
 from goal.doctor.python_diag_core import PythonDiagnosticsCore
 
+_NAME_SEPARATORS_RE = re.compile(r"[-_.]+")
+
+
+def _canonical_name(name: str) -> str:
+    """PEP 503 normalization: runs of ``-``, ``_`` and ``.`` become ``-``."""
+    return _NAME_SEPARATORS_RE.sub("-", name).lower()
+
 
 class PythonDiagnostics(PythonDiagnosticsCore):
     """Python project diagnostics — extended PY010–PY014 checks layered on
@@ -220,15 +228,17 @@ class PythonDiagnostics(PythonDiagnosticsCore):
     def check_py012_dist_cleanup(self) -> None:
         """PY012: Check for stale package files in dist/ directory."""
         dist_dir = self.project_dir / "dist"
-        if not dist_dir.exists():
-            return
-
         name_match = re.search(r'^name\s*=\s*"([^"]+)"', self.content, re.MULTILINE)
         if not name_match:
             return
         project_name = name_match.group(1)
 
-        stale_files = self._collect_stale_dist_files(dist_dir, project_name)
+        # A missing or empty dist/ costs one failed open or one empty scan;
+        # nothing is stat()ed or matched in that common case.
+        try:
+            stale_files = self._collect_stale_dist_files(dist_dir, project_name)
+        except (FileNotFoundError, NotADirectoryError):
+            return
         if not stale_files:
             return
 
@@ -252,11 +262,18 @@ class PythonDiagnostics(PythonDiagnosticsCore):
 
     @staticmethod
     def _collect_stale_dist_files(dist_dir: Path, project_name: str) -> List[str]:
-        return [
-            f.name
-            for f in dist_dir.iterdir()
-            if f.is_file() and not f.name.startswith(f"{project_name}-")
-        ]
+        # DirEntry.is_file() answers from the directory listing's d_type,
+        # saving a stat() per artifact compared with Path.is_file().
+        # Names are compared in canonical form once: wheels and new sdists
+        # spell "my-pkg" as "my_pkg", older sdists keep the dashes.
+        prefix = f"{_canonical_name(project_name)}-"
+        with os.scandir(dist_dir) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if not _canonical_name(entry.name).startswith(prefix)
+                and entry.is_file()
+            ]
 
     @staticmethod
     def _remove_stale_dist_files(dist_dir: Path, stale_files: List[str]) -> List[str]:
@@ -2,10 +2,58 @@
 
 import re
 import os
-import subprocess
 from collections import Counter, defaultdict
+from operator import itemgetter
 from typing import List, Dict, Optional, Tuple
 
+from goal.generator.git_ops import _git
+from goal.keyword_match import build_keyword_automaton, split_literal_patterns
+
+# Added-line discriminators used by classification.
+_RE_ADDED_DEF = re.compile(r"^\+\s*def\s+(\w+)\s*\(", re.MULTILINE)
+_RE_ADDED_CLICK = re.compile(r"^\+\s*@click\.(command|group|option)\b", re.MULTILINE)
+# Added Python functions, classes and JavaScript functions in one pattern;
+# each added line can match at most one branch.
+_RE_ADDED_SYMBOL = re.compile(
+    r"^\+\s*(?:def\s+(?P<py>\w+)\s*\("
+    r"|class\s+(?P<cls>\w+)"
+    r"|(?:function|const|let|var)\s+(?P<js>\w+)\s*[=(])",
+    re.MULTILINE,
+)
+
+# Last (diff, diff.lower()) pair; classification and the action summary
+# lowercase the same diff during one message generation.
+_LOWERED: List[Tuple[str, str]] = [("", "")]
+
+
+def _lowered(text: str) -> str:
+    """Return ``text.lower()``, reusing the copy made for the same string."""
+    source, lowered = _LOWERED[0]
+    if text is not source:
+        lowered = text.lower()
+        _LOWERED[0] = (text, lowered)
+    return lowered
+
+
+def _compile_alternation(patterns: List[str], flags: int = 0) -> "re.Pattern":
+    """Join ``patterns`` into one alternation so a single ``finditer`` scans them all."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+def _compile_file_probe(patterns_by_type: Dict[str, List[str]]) -> "re.Pattern":
+    """Build a regex whose single ``match`` reports every pattern found in a path.
+
+    Each pattern sits in its own optional lookahead with a ``<type>__<index>``
+    named group, so ``groupdict()`` shows which patterns hit anywhere in the
+    string, the same result as a ``re.search`` per pattern.
+    """
+    probes = "".join(
+        f"(?=.*?(?P<{change_type}__{i}>{pattern}))?"
+        for change_type, patterns in patterns_by_type.items()
+        for i, pattern in enumerate(patterns)
+    )
+    return re.compile(f"^{probes}")
+
 
 class ChangeAnalyzer:
     """Analyze git changes to classify type, detect scope, and extract functions."""
@@ -127,15 +175,40 @@ class ChangeAnalyzer:
         "config": r"config|setup|pyproject",
     }
 
+    # Compiled once at class load instead of per call.
+    _SCOPE_PROBE = _compile_file_probe({s: [p] for s, p in SCOPE_PATTERNS.items()})
+
+    # Literal keywords are counted with one Aho-Corasick walk (pyahocorasick)
+    # or C-level ``str.count``/``in``; only the few real regexes (``\.py$``...)
+    # go through the regex engine.
+    _LITERAL_TYPE, _REGEX_TYPE = split_literal_patterns(TYPE_PATTERNS)
+    _KEYWORD_AUTOMATON = build_keyword_automaton(_LITERAL_TYPE)
+    _COMPILED_REGEX_TYPE = {
+        t: _compile_alternation(ps, re.IGNORECASE) for t, ps in _REGEX_TYPE.items()
+    }
+
+    # Case-insensitive probes used instead of lowercasing the whole diff.
+    _FIX_SIGNAL_RE = re.compile(r"fix|bug|error|exception|crash", re.IGNORECASE)
+    _NEW_COMMAND_RE = re.compile(r"new command|add command", re.IGNORECASE)
+    _REGEX_FILE_PROBE = _compile_file_probe(_REGEX_TYPE)
+
     def classify_change_type(
         self, files: List[str], diff_content: str, stats: Dict[str, int]
     ) -> str:
         """Classify the type of change using pattern matching and heuristics."""
-        scores = defaultdict(int)
-
         # Detect signal types from files and diff
         signals = self._detect_signals(files, diff_content)
 
+        # Exclusive docs/CI changes are decided by their paths alone, so the
+        # keyword/regex scoring sweep is skipped for them.
+        if files and not signals["has_package_code"]:
+            if signals["has_docs_only"]:
+                return "docs"
+            if signals["has_ci_only"]:
+                return "build"
+
+        scores = defaultdict(int)
+
         # Score based on file patterns and diff content
         self._score_by_file_patterns(scores, files)
         self._score_by_diff_content(scores, diff_content)
@@ -146,62 +219,96 @@ class ChangeAnalyzer:
         return self._resolve_change_type(scores, signals, files, diff_content)
 
     def _detect_signals(self, files: List[str], diff_content: str) -> Dict[str, bool]:
-        """Detect key signals from files and diff content."""
+        """Detect key signals from files and diff content.
+
+        All path-based flags are collected in a single walk over ``files``;
+        the ``*_only`` flags keep ``all()`` semantics (true for no files).
+        """
+        has_package_code = has_goal_python = False
+        has_version_path = has_build_path = False
+        docs_only = ci_only = True
+        for f in files:
+            if f.endswith((".py", ".js", ".ts")) and f.startswith(
+                ("goal/", "src/", "lib/")
+            ):
+                has_package_code = True
+                if f.startswith("goal/") and f.endswith(".py"):
+                    has_goal_python = True
+            if docs_only and not (
+                f.endswith((".md", ".rst", ".txt"))
+                or "docs/" in f
+                or "readme" in f.lower()
+            ):
+                docs_only = False
+            if ci_only and not (
+                f.startswith((".github/", ".gitlab/")) or f.endswith((".yml", ".yaml"))
+            ):
+                ci_only = False
+            if not has_version_path and (
+                "version" in f or "package" in f or "pyproject" in f
+            ):
+                has_version_path = True
+            if not has_build_path and ("docker" in f or "ci" in f or "cd" in f):
+                has_build_path = True
         return {
-            "has_package_code": self._has_package_code(files),
-            "has_docs_only": self._is_docs_only(files),
-            "has_ci_only": self._is_ci_only(files),
-            "has_new_goal_python_file": self._has_new_goal_python_file(
-                files, diff_content
-            ),
+            "has_package_code": has_package_code,
+            "has_docs_only": docs_only,
+            "has_ci_only": ci_only,
+            "has_new_goal_python_file": has_goal_python
+            and "new file mode" in diff_content,
+            "has_version_path": has_version_path,
+            "has_build_path": has_build_path,
         }
 
-    def _has_package_code(self, files: List[str]) -> bool:
-        """Check if changes include code in main package directories."""
-        return any(
-            (f.startswith("goal/") or f.startswith("src/") or f.startswith("lib/"))
-            and (f.endswith(".py") or f.endswith(".js") or f.endswith(".ts"))
-            for f in files
-        )
-
-    def _is_docs_only(self, files: List[str]) -> bool:
-        """Check if changes are documentation-only."""
-        return all(
-            f.endswith((".md", ".rst", ".txt")) or "docs/" in f or "readme" in f.lower()
-            for f in files
-        )
-
-    def _is_ci_only(self, files: List[str]) -> bool:
-        """Check if changes are CI/CD-only."""
-        return all(
-            f.startswith(".github/")
-            or f.startswith(".gitlab/")
-            or f.endswith((".yml", ".yaml"))
-            for f in files
-        )
-
-    def _has_new_goal_python_file(self, files: List[str], diff_content: str) -> bool:
-        """Check if a new Python file is being added to goal/."""
-        return "new file mode" in diff_content and any(
-            f.startswith("goal/") and f.endswith(".py") for f in files
-        )
-
     def _score_by_file_patterns(self, scores: defaultdict, files: List[str]) -> None:
         """Score change types based on file path patterns."""
+        automaton = self._KEYWORD_AUTOMATON
         for file_path in files:
             file_lower = file_path.lower()
-            for change_type, patterns in self.TYPE_PATTERNS.items():
-                for pattern in patterns:
-                    if re.search(pattern, file_lower):
-                        scores[change_type] += 2
+            hits = Counter()
+            if automaton is not None:
+                for _word, types in {v for _, v in automaton.iter(file_lower)}:
+                    hits.update(types)
+            else:
+                for change_type, words in self._LITERAL_TYPE.items():
+                    count = sum(1 for w in words if w in file_lower)
+                    if count:
+                        hits[change_type] += count
+            match = self._REGEX_FILE_PROBE.match(file_lower)
+            for name, hit in match.groupdict().items():
+                if hit is not None:
+                    hits[name.split("__", 1)[0]] += 1
+            # Insert the matched types in TYPE_PATTERNS order, whatever order
+            # the automaton reported them in: max() breaks ties by it.
+            if hits:
+                for change_type in self.TYPE_PATTERNS:
+                    if change_type in hits:
+                        scores[change_type] += 2 * hits[change_type]
 
     def _score_by_diff_content(self, scores: defaultdict, diff_content: str) -> None:
         """Score change types based on diff content patterns."""
-        diff_lower = diff_content.lower()
-        for change_type, patterns in self.TYPE_PATTERNS.items():
-            for pattern in patterns:
-                matches = len(re.findall(pattern, diff_lower))
-                scores[change_type] += matches
+        # Exact per-keyword counts need one case-folded buffer; it is shared
+        # with short_action_summary. Case-insensitive regex scans of the raw
+        # diff were measured ~10x slower than lower() plus substring counts.
+        diff_lower = _lowered(diff_content)
+        # Every type gets a score from here on, in TYPE_PATTERNS order after
+        # the ones the file paths matched.
+        for change_type in self.TYPE_PATTERNS:
+            scores.setdefault(change_type, 0)
+        automaton = self._KEYWORD_AUTOMATON
+        if automaton is not None:
+            for _, (_word, types) in automaton.iter(diff_lower):
+                for change_type in types:
+                    scores[change_type] += 1
+        else:
+            for change_type, words in self._LITERAL_TYPE.items():
+                count = sum(diff_lower.count(w) for w in words)
+                if count:
+                    scores[change_type] += count
+        for change_type, regex in self._COMPILED_REGEX_TYPE.items():
+            count = sum(1 for _ in regex.finditer(diff_content))
+            if count:
+                scores[change_type] += count
 
     def _score_by_statistics(
         self, scores: defaultdict, files: List[str], stats: Dict[str, int]
@@ -235,7 +342,7 @@ class ChangeAnalyzer:
         self._score_package_signals(scores, signals, diff_content)
         self._score_text_signals(scores, diff_content)
         self._score_file_signals(scores, signals)
-        self._score_path_signals(scores, files)
+        self._score_path_signals(scores, signals)
 
     def _score_package_signals(
         self, scores: defaultdict, signals: Dict[str, bool], diff_content: str
@@ -246,10 +353,7 @@ class ChangeAnalyzer:
             self._score_new_functionality(scores, signals, diff_content)
 
     def _score_text_signals(self, scores: defaultdict, diff_content: str) -> None:
-        if any(
-            k in diff_content.lower()
-            for k in ["fix", "bug", "error", "exception", "crash"]
-        ):
+        if self._FIX_SIGNAL_RE.search(diff_content):
             scores["fix"] += 2
 
     def _score_file_signals(
@@ -262,26 +366,23 @@ class ChangeAnalyzer:
         if signals["has_ci_only"]:
             scores["build"] += 5
 
-    def _score_path_signals(self, scores: defaultdict, files: List[str]) -> None:
-        if any("version" in f or "package" in f or "pyproject" in f for f in files):
+    def _score_path_signals(
+        self, scores: defaultdict, signals: Dict[str, bool]
+    ) -> None:
+        if signals["has_version_path"]:
             scores["chore"] += 3
-        if any("docker" in f or "ci" in f or "cd" in f for f in files):
+        if signals["has_build_path"]:
             scores["build"] += 3
 
     def _score_new_functionality(
         self, scores: defaultdict, signals: Dict[str, bool], diff_content: str
     ) -> None:
         """Score for new functionality signals in code."""
-        if re.search(r"^\+\s*def\s+\w+\s*\(", diff_content, re.MULTILINE):
+        if _RE_ADDED_DEF.search(diff_content):
             scores["feat"] += 3
-        if re.search(
-            r"^\+\s*@click\.(command|group|option)\b", diff_content, re.MULTILINE
-        ):
+        if _RE_ADDED_CLICK.search(diff_content):
             scores["feat"] += 4
-        if (
-            "new command" in diff_content.lower()
-            or "add command" in diff_content.lower()
-        ):
+        if self._NEW_COMMAND_RE.search(diff_content):
             scores["feat"] += 2
 
     def _resolve_change_type(
@@ -313,9 +414,7 @@ class ChangeAnalyzer:
 
         # Prefer feat for new capabilities
         if has_package_code and (
-            re.search(
-                r"^\+\s*@click\.(command|group|option)\b", diff_content, re.MULTILINE
-            )
+            _RE_ADDED_CLICK.search(diff_content)
             or has_new_goal_python_file
             or scores.get("feat", 0) >= scores.get("chore", 0)
         ):
@@ -329,25 +428,26 @@ class ChangeAnalyzer:
 
     def detect_scope(self, files: List[str]) -> Optional[str]:
         """Detect the scope of changes based on file paths."""
-        scope_counts = Counter()
+        # Prefer core package scope when present (goal/* always matches "goal")
+        if any(f.startswith("goal/") for f in files):
+            return "goal"
 
+        scope_counts = Counter()
         for file_path in files:
-            for scope, pattern in self.SCOPE_PATTERNS.items():
-                if re.search(pattern, file_path.lower()):
-                    scope_counts[scope] += 1
+            match = self._SCOPE_PROBE.match(file_path.lower())
+            for name, hit in match.groupdict().items():
+                if hit is not None:
+                    scope_counts[name.split("__", 1)[0]] += 1
 
         if scope_counts:
-            # Prefer core package scope when present
-            if any(f.startswith("goal/") for f in files):
-                return "goal"
-            return scope_counts.most_common(1)[0][0]
+            return max(scope_counts.items(), key=itemgetter(1))[0]
 
         # Try to extract from directory structure
         dirs = [os.path.dirname(f).split("/")[0] for f in files if os.path.dirname(f)]
         dir_counts = Counter(d for d in dirs if d and d != ".")
 
         if dir_counts:
-            most_common_dir = dir_counts.most_common(1)[0][0]
+            most_common_dir = max(dir_counts.items(), key=itemgetter(1))[0]
             # Avoid generic scopes
             if most_common_dir not in ["src", "lib", "app"]:
                 return most_common_dir
@@ -356,30 +456,25 @@ class ChangeAnalyzer:
 
     def extract_functions_changed(self, diff_content: str) -> List[str]:
         """Extract function/method names from diff."""
-        functions = []
-
-        # Python functions
-        py_funcs = re.findall(r"^\+\s*def\s+(\w+)\s*\(", diff_content, re.MULTILINE)
-        functions.extend(py_funcs)
-
-        # Python classes
-        py_classes = re.findall(r"^\+\s*class\s+(\w+)", diff_content, re.MULTILINE)
-        functions.extend([f"class {c}" for c in py_classes])
-
-        # JavaScript/TypeScript functions
-        js_funcs = re.findall(
-            r"^\+\s*(?:function|const|let|var)\s+(\w+)\s*[=(]",
-            diff_content,
-            re.MULTILINE,
-        )
-        functions.extend(js_funcs)
-
-        # JavaScript classes
-        js_classes = re.findall(r"^\+\s*class\s+(\w+)", diff_content, re.MULTILINE)
-        functions.extend([f"class {c}" for c in js_classes])
-
-        # Return unique functions, limited to 5
-        return list(set(functions))[:5]
+        # Python functions, then classes (Python and JavaScript share the
+        # syntax), then JavaScript/TypeScript functions - from one scan.
+        by_kind: Dict[str, Dict[str, None]] = {"py": {}, "cls": {}, "js": {}}
+        for match in _RE_ADDED_SYMBOL.finditer(diff_content):
+            kind = match.lastgroup
+            name = match.group(kind)
+            by_kind[kind][f"class {name}" if kind == "cls" else name] = None
+            # Python functions rank first, so five of them settle the result.
+            if len(by_kind["py"]) >= 5:
+                break
+
+        # Return unique functions in diff order, limited to 5
+        functions = dict.fromkeys(by_kind["py"])
+        for kind in ("cls", "js"):
+            for name in by_kind[kind]:
+                if len(functions) >= 5:
+                    break
+                functions.setdefault(name)
+        return list(functions)[:5]
 
 
 class ContentAnalyzer:
@@ -411,34 +506,56 @@ class ContentAnalyzer:
 
     def short_action_summary(self, files: List[str], diff_content: str) -> str:
         """Return a short 2–6 word action summary (no LLM)."""
-        file_lower = [f.lower() for f in files]
-        diff_lower = diff_content.lower()
+        path_flags = self._scan_paths(files)
+        diff_lower = _lowered(diff_content)
 
-        tags = self._detect_tags(file_lower, diff_lower)
+        tags = self._detect_tags(path_flags, diff_lower)
 
         if tags:
             return self._summary_from_tags(tags)
 
-        fallback = self._summary_from_paths(file_lower, files)
+        fallback = self._summary_from_paths(path_flags, files)
         if fallback:
             return fallback
 
         return "update project"
 
-    def _detect_tags(self, file_lower: List[str], diff_lower: str) -> List[str]:
-        """Detect thematic tags from files and diff content."""
-        tags: List[str] = []
-        for label, file_needle, diff_needle in self._TAG_DETECTORS:
-            if any(file_needle in f for f in file_lower) or diff_needle in diff_lower:
-                tags.append(label)
+    def _scan_paths(self, files: List[str]) -> Dict[str, bool]:
+        """Collect every path flag used by the summary in one pass over files.
+
+        Keys are the ``_TAG_DETECTORS`` labels plus ``goal``, ``docs`` and
+        ``examples``.
+        """
+        has = dict.fromkeys((label for label, _, _ in self._TAG_DETECTORS), False)
+        has.update(goal=False, docs=False, examples=False)
+        for f in files:
+            f = f.lower()
+            for label, file_needle, _ in self._TAG_DETECTORS:
+                if file_needle in f:
+                    has[label] = True
+            if f.startswith("goal/"):
+                has["goal"] = True
+            if f.startswith("docs/") or "readme.md" in f:
+                has["docs"] = True
+            if f.startswith("examples/"):
+                has["examples"] = True
+        return has
+
+    def _detect_tags(self, path_flags: Dict[str, bool], diff_lower: str) -> List[str]:
+        """Detect thematic tags from path flags and diff content."""
+        tags = [
+            label
+            for label, _, diff_needle in self._TAG_DETECTORS
+            if path_flags[label] or diff_needle in diff_lower
+        ]
 
         # CLI tag only when no other tags matched
-        if not tags:
-            has_cli = any(f.startswith("goal/") for f in file_lower) and (
-                "@click." in diff_lower or "click.option" in diff_lower
-            )
-            if has_cli:
-                tags.append("cli workflow")
+        if (
+            not tags
+            and path_flags["goal"]
+            and ("@click." in diff_lower or "click.option" in diff_lower)
+        ):
+            tags.append("cli workflow")
         return tags
 
     def _summary_from_tags(self, tags: List[str]) -> str:
@@ -451,17 +568,15 @@ class ContentAnalyzer:
         return f"add {pick[0]}"
 
     def _summary_from_paths(
-        self, file_lower: List[str], files: List[str]
+        self, path_flags: Dict[str, bool], files: List[str]
     ) -> Optional[str]:
         """Derive summary from file paths when no tags matched."""
-        has_goal = any(f.startswith("goal/") for f in file_lower)
+        has_goal = path_flags["goal"]
 
-        if any(f.startswith("docs/") for f in file_lower) or any(
-            "readme.md" in f for f in file_lower
-        ):
+        if path_flags["docs"]:
             return "update cli docs" if has_goal else "update docs"
 
-        if any(f.startswith("examples/") for f in file_lower):
+        if path_flags["examples"]:
             return "update examples and cli" if has_goal else "update examples"
 
         if len(files) == 1:
@@ -492,7 +607,25 @@ class ContentAnalyzer:
         added_lines = self._get_added_lines(path, cached)
         if added_lines is None:
             return []
-
+        return self._notes_from_added_lines(path, added_lines)
+
+    def per_file_notes_batch(
+        self, paths: List[str], cached: bool = True
+    ) -> Dict[str, List[str]]:
+        """Like :meth:`per_file_notes` for several paths, using one ``git diff``."""
+        added_by_path = self._get_added_lines_batch(paths, cached)
+        if added_by_path is None:
+            return {p: [] for p in paths}
+        notes: Dict[str, List[str]] = {}
+        for p in paths:
+            added_lines = added_by_path.get(p)
+            if added_lines is None:
+                # Header not parsed (quoted name, rename...): ask git per path.
+                added_lines = self._get_added_lines(p, cached) or []
+            notes[p] = self._notes_from_added_lines(p, added_lines)
+        return notes
+
+    def _notes_from_added_lines(self, path: str, added_lines: List[str]) -> List[str]:
         notes: List[str] = []
         suffix = os.path.splitext(path)[1].lower()
         handler_name = self._EXT_NOTE_HANDLERS.get(suffix)
@@ -502,15 +635,49 @@ class ContentAnalyzer:
         # Deduplicate and cap
         return list(dict.fromkeys(notes))[:3]
 
+    @staticmethod
+    def _get_added_lines_batch(
+        paths: List[str], cached: bool
+    ) -> Optional[Dict[str, List[str]]]:
+        """Extract added lines for every path from a single ``git diff -U0``."""
+        # Keep non-ASCII names unquoted and pin the prefixes (diff.noprefix and
+        # diff.mnemonicPrefix change them) so ``+++ b/<path>`` matches ``paths``.
+        try:
+            diff = _git(
+                "-c",
+                "core.quotePath=false",
+                "diff",
+                "-U0",
+                "--src-prefix=a/",
+                "--dst-prefix=b/",
+                cached=cached,
+                paths=paths,
+            ).stdout
+        except Exception:
+            return None
+
+        added: Dict[str, List[str]] = {}
+        current: Optional[List[str]] = None
+        in_header = False
+        for line in diff.splitlines():
+            if line.startswith("diff --git "):
+                current, in_header = None, True
+            elif in_header:
+                if line.startswith("+++ b/"):
+                    # git ends the header with a tab when the path has spaces.
+                    path = line[len("+++ b/") :].rstrip("\t")
+                    current = added.setdefault(path, [])
+                elif line.startswith("@@"):
+                    in_header = False
+            elif current is not None and line.startswith("+"):
+                current.append(line[1:].strip())
+        return added
+
     @staticmethod
     def _get_added_lines(path: str, cached: bool) -> Optional[List[str]]:
         """Extract added lines from git diff."""
-        cmd = ["git", "diff"]
-        if cached:
-            cmd.append("--cached")
-        cmd.extend(["-U0", "--", path])
         try:
-            diff = subprocess.run(cmd, capture_output=True, text=True).stdout
+            diff = _git("diff", "-U0", cached=cached, paths=[path]).stdout
         except Exception:
             return None
         return [
@@ -519,19 +686,36 @@ class ContentAnalyzer:
             if l.startswith("+") and not l.startswith("+++")
         ]
 
-    @staticmethod
-    def _notes_python(added_lines: List[str], _path: str, notes: List[str]) -> None:
+    # Added lines are already stripped, so ``match`` anchors at line start.
+    _PY_CLASS_RE = re.compile(r"class\s+(\w+)")
+    _PY_DEF_RE = re.compile(r"def\s+(\w+)\s*\(")
+
+    @classmethod
+    def _notes_python(
+        cls, added_lines: List[str], _path: str, notes: List[str]
+    ) -> None:
         """Collect notes for Python files."""
-        joined = "\n".join(added_lines)
-        classes = re.findall(r"^class\s+(\w+)", joined, re.MULTILINE)
-        funcs = re.findall(r"^def\s+(\w+)\s*\(", joined, re.MULTILINE)
+        classes = set()
+        funcs = set()
+        has_click_option = False
+        has_markdown = False
+        for line in added_lines:
+            m = cls._PY_CLASS_RE.match(line)
+            if m:
+                classes.add(m.group(1))
+            else:
+                m = cls._PY_DEF_RE.match(line)
+                if m:
+                    funcs.add(m.group(1))
+            has_click_option = has_click_option or "click.option" in line
+            has_markdown = has_markdown or "markdown" in line.lower()
         if classes:
-            notes.append(f"add classes: {', '.join(sorted(set(classes))[:4])}")
+            notes.append(f"add classes: {', '.join(sorted(classes)[:4])}")
         if funcs:
-            notes.append(f"add functions: {', '.join(sorted(set(funcs))[:4])}")
-        if any("click.option" in l for l in added_lines):
+            notes.append(f"add functions: {', '.join(sorted(funcs)[:4])}")
+        if has_click_option:
             notes.append("add/update cli options")
-        if any("markdown" in l.lower() for l in added_lines):
+        if has_markdown:
             notes.append("add markdown formatting")
 
     @classmethod
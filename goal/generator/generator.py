@@ -1,22 +1,15 @@
 """Commit message generator - extracted from commit_generator.py."""
 
+import hashlib
+import heapq
+import io
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
-try:
-    from goal.generator.git_ops import GitDiffOperations
-    from goal.generator.analyzer import ChangeAnalyzer, ContentAnalyzer
-    from goal.smart_commit import SmartCommitGenerator
-    from goal.summary import EnhancedSummaryGenerator
-
-    HAS_SMART_COMMIT = True
-    HAS_ENHANCED_SUMMARY = True
-except ImportError:
-    HAS_SMART_COMMIT = False
-    HAS_ENHANCED_SUMMARY = False
-    GitDiffOperations = None
-    ChangeAnalyzer = None
-    ContentAnalyzer = None
+from goal.generator.git_ops import GitDiffOperations
+from goal.generator.analyzer import ChangeAnalyzer, ContentAnalyzer
 
 
 class CommitMessageGenerator:
@@ -27,17 +20,61 @@ class CommitMessageGenerator:
         self.config = config
         self._smart_generator = None
         self._enhanced_generator = None
-        self._git_ops = GitDiffOperations() if GitDiffOperations else None
-        self._change_analyzer = ChangeAnalyzer() if ChangeAnalyzer else None
-        self._content_analyzer = ContentAnalyzer() if ContentAnalyzer else None
+        self._git_ops = GitDiffOperations()
+        self._change_analyzer = ChangeAnalyzer()
+        self._content_analyzer = ContentAnalyzer()
+        self._diff_key_source: Optional[str] = None
+        self._diff_key_value = b""
+
+    # Smart/enhanced helpers pull in sizeable modules, so they are imported
+    # and constructed on first use rather than in __init__. A failed import
+    # is remembered as False so later accesses do not retry it.
+
+    @property
+    def smart_generator(self):
+        """SmartCommitGenerator for ``config``, or None when no config was given."""
+        if self._smart_generator is None and self.config:
+            try:
+                from goal.smart_commit import SmartCommitGenerator
+            except ImportError:
+                self._smart_generator = False
+            else:
+                self._smart_generator = SmartCommitGenerator(self.config)
+        return self._smart_generator or None
 
-        # Initialize smart generator if config provided
-        if config and HAS_SMART_COMMIT:
-            self._smart_generator = SmartCommitGenerator(config)
+    @property
+    def enhanced_generator(self):
+        """EnhancedSummaryGenerator, or None when the summary package is unavailable."""
+        if self._enhanced_generator is None:
+            try:
+                from goal.summary import EnhancedSummaryGenerator
+            except ImportError:
+                self._enhanced_generator = False
+            else:
+                self._enhanced_generator = EnhancedSummaryGenerator(self.config or {})
+        return self._enhanced_generator or None
 
-        # Initialize enhanced summary generator
-        if HAS_ENHANCED_SUMMARY:
-            self._enhanced_generator = EnhancedSummaryGenerator(config or {})
+    def _prime_caches(
+        self, cached: bool = True, paths: Optional[List[str]] = None
+    ) -> None:
+        """Fetch git diff metadata and content concurrently before analysis.
+
+        Metadata comes from one ``--raw --numstat`` call; the full diff and,
+        for a narrowed diff, the whole-diff stats are separate git processes.
+        They are independent read-only queries, so their waits overlap.
+        """
+        if not self._git_ops:
+            return
+        calls = [
+            (self._git_ops.prime_caches, cached, paths),
+            (self._git_ops.get_diff_content, cached, paths),
+        ]
+        if paths:
+            calls.append((self._git_ops.get_diff_stats, cached))
+        with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+            futures = [pool.submit(*call) for call in calls]
+        for future in futures:
+            future.result()
 
     def get_diff_stats(self, cached: bool = True) -> Dict[str, int]:
         """Get diff statistics using git command."""
@@ -77,27 +114,52 @@ class CommitMessageGenerator:
             return self._git_ops.get_diff_content(cached, paths)
         return ""
 
+    def _diff_key(self, diff_content: str) -> bytes:
+        """Short digest of ``diff_content``, recomputed only when the diff changes."""
+        if diff_content is not self._diff_key_source:
+            self._diff_key_source = diff_content
+            self._diff_key_value = hashlib.blake2b(
+                diff_content.encode(), digest_size=8
+            ).digest()
+        return self._diff_key_value
+
     def classify_change_type(
         self, files: List[str], diff_content: str, stats: Dict[str, int]
     ) -> str:
         """Classify the type of change using pattern matching and heuristics."""
-        if self._change_analyzer:
-            return self._change_analyzer.classify_change_type(
+        if not self._change_analyzer:
+            return "chore"
+        key = (
+            "classify",
+            self._diff_key(diff_content),
+            tuple(files),
+            tuple(sorted(stats.items())),
+        )
+        if key not in self.cache:
+            self.cache[key] = self._change_analyzer.classify_change_type(
                 files, diff_content, stats
             )
-        return "chore"
+        return self.cache[key]
 
     def detect_scope(self, files: List[str]) -> Optional[str]:
         """Detect the scope of changes based on file paths."""
-        if self._change_analyzer:
-            return self._change_analyzer.detect_scope(files)
-        return None
+        if not self._change_analyzer:
+            return None
+        key = ("scope", tuple(files))
+        if key not in self.cache:
+            self.cache[key] = self._change_analyzer.detect_scope(files)
+        return self.cache[key]
 
     def extract_functions_changed(self, diff_content: str) -> List[str]:
         """Extract function/method names from diff."""
-        if self._change_analyzer:
-            return self._change_analyzer.extract_functions_changed(diff_content)
-        return []
+        if not self._change_analyzer:
+            return []
+        key = ("functions", self._diff_key(diff_content))
+        if key not in self.cache:
+            self.cache[key] = self._change_analyzer.extract_functions_changed(
+                diff_content
+            )
+        return list(self.cache[key])
 
     def _short_action_summary(self, files: List[str], diff_content: str) -> str:
         """Return a short 2–6 word action summary (no LLM)."""
@@ -111,6 +173,14 @@ class CommitMessageGenerator:
             return self._content_analyzer.per_file_notes(path, cached)
         return []
 
+    def _per_file_notes_batch(
+        self, paths: List[str], cached: bool = True
+    ) -> Dict[str, List[str]]:
+        """Per-file notes for all ``paths`` from one ``git diff -U0`` call."""
+        if self._content_analyzer:
+            return self._content_analyzer.per_file_notes_batch(paths, cached)
+        return {p: [] for p in paths}
+
     def generate_commit_message(
         self,
         cached: bool = True,
@@ -118,28 +188,34 @@ class CommitMessageGenerator:
         abstraction_level: str = None,
     ) -> str:
         """Generate a conventional commit message."""
+        self._prime_caches(cached, paths)
+
         # Get all the data
         files = self.get_changed_files(cached, paths=paths)
         if not files:
             return None
 
         # Use smart generator if available and configured
-        if self._smart_generator and abstraction_level != "legacy":
+        if self.smart_generator and abstraction_level != "legacy":
             try:
-                analysis = self._smart_generator.analyze_changes(files)
+                analysis = self.smart_generator.analyze_changes(files)
                 level = abstraction_level if abstraction_level else None
-                return self._smart_generator.generate_message(analysis, level)
+                return self.smart_generator.generate_message(analysis, level)
             except Exception:
                 pass  # Fall back to legacy generation
 
         diff_content = self.get_diff_content(cached, paths=paths)
         stats = self.get_diff_stats(cached)
 
-        # Classify the change
-        change_type = self.classify_change_type(files, diff_content, stats)
-
-        # Detect scope
-        scope = self.detect_scope(files)
+        # Reuse the enhanced summary's intent/scope when it already ran on
+        # this diff; otherwise classify and detect scope from scratch.
+        precomputed = self.cache.get(self._precomputed_key(cached, paths, diff_content))
+        if precomputed and precomputed.get("change_type"):
+            change_type = precomputed["change_type"]
+            scope = precomputed["scope"]
+        else:
+            change_type = self.classify_change_type(files, diff_content, stats)
+            scope = self.detect_scope(files)
 
         # Extract functions for detailed messages
         functions = self.extract_functions_changed(diff_content)
@@ -158,7 +234,7 @@ class CommitMessageGenerator:
         self, level: str = "auto", cached: bool = True
     ) -> Optional[Dict[str, Any]]:
         """Generate commit message with abstraction-based analysis."""
-        if not self._smart_generator:
+        if not self.smart_generator:
             return None
 
         files = self.get_changed_files(cached)
@@ -166,16 +242,16 @@ class CommitMessageGenerator:
             return None
 
         try:
-            analysis = self._smart_generator.analyze_changes(files)
+            analysis = self.smart_generator.analyze_changes(files)
             actual_level = (
                 level
                 if level != "auto"
-                else self._smart_generator.abstraction.determine_abstraction_level(
+                else self.smart_generator.abstraction.determine_abstraction_level(
                     analysis
                 )
             )
 
-            title = self._smart_generator.generate_message(analysis, actual_level)
+            title = self.smart_generator.generate_message(analysis, actual_level)
 
             # Generate detailed body
             detailed = self.generate_detailed_message(cached)
@@ -194,7 +270,7 @@ class CommitMessageGenerator:
         self, cached: bool = True, commit_hash: str = None
     ) -> Optional[Dict[str, Any]]:
         """Generate structured changelog entry using smart abstraction."""
-        if not self._smart_generator:
+        if not self.smart_generator:
             return None
 
         files = self.get_changed_files(cached)
@@ -202,16 +278,27 @@ class CommitMessageGenerator:
             return None
 
         try:
-            analysis = self._smart_generator.analyze_changes(files)
-            return self._smart_generator.generate_changelog_entry(analysis, commit_hash)
+            analysis = self.smart_generator.analyze_changes(files)
+            return self.smart_generator.generate_changelog_entry(analysis, commit_hash)
         except Exception:
             return None
 
+    def _precomputed_key(
+        self, cached: bool, paths: Optional[List[str]], diff_content: str
+    ) -> tuple:
+        """Cache key for intermediates shared by the enhanced and legacy paths."""
+        return (
+            "precomputed",
+            cached,
+            tuple(paths) if paths else None,
+            self._diff_key(diff_content),
+        )
+
     def generate_enhanced_summary(
         self, cached: bool = True, paths: Optional[List[str]] = None
     ) -> Optional[Dict[str, Any]]:
         """Generate enhanced business-value focused summary."""
-        if not self._enhanced_generator:
+        if not self.enhanced_generator:
             return None
 
         files = self.get_changed_files(cached, paths=paths)
@@ -229,7 +316,7 @@ class CommitMessageGenerator:
                 lines_added = stats.get("added", 0)
                 lines_deleted = stats.get("deleted", 0)
 
-            result = self._enhanced_generator.generate_enhanced_summary(
+            result = self.enhanced_generator.generate_enhanced_summary(
                 files,
                 diff_content,
                 lines_added=lines_added,
@@ -239,6 +326,10 @@ class CommitMessageGenerator:
             # Use intent from enhanced summary (more accurate classification)
             commit_type = result.get("intent", "refactor")
             scope = self.detect_scope(files)
+            self.cache[self._precomputed_key(cached, paths, diff_content)] = {
+                "change_type": result.get("intent"),
+                "scope": scope,
+            }
 
             # Enhance title with conventional commit format
             if result.get("title"):
@@ -252,7 +343,7 @@ class CommitMessageGenerator:
         self, cached: bool, paths: Optional[List[str]]
     ) -> Optional[Dict[str, str]]:
         """Try to generate enhanced summary if available."""
-        if not self._enhanced_generator:
+        if not self.enhanced_generator:
             return None
         enhanced = self.generate_enhanced_summary(cached, paths)
         if not enhanced:
@@ -304,13 +395,12 @@ class CommitMessageGenerator:
         dir_counter = Counter((f.split("/")[0] if "/" in f else ".") for f in files)
         ext_counter = Counter((Path(f).suffix or "other") for f in files)
 
+        top_dirs = heapq.nlargest(6, dir_counter.items(), key=itemgetter(1))
+        top_exts = heapq.nlargest(6, ext_counter.items(), key=itemgetter(1))
+
         parts = ["\nSummary:"]
-        parts.append(
-            f"- Dirs: {', '.join(f'{k}={v}' for k, v in dir_counter.most_common(6))}"
-        )
-        parts.append(
-            f"- Exts: {', '.join(f'{k}={v}' for k, v in ext_counter.most_common(6))}"
-        )
+        parts.append(f"- Dirs: {', '.join(f'{k}={v}' for k, v in top_dirs)}")
+        parts.append(f"- Exts: {', '.join(f'{k}={v}' for k, v in top_exts)}")
         parts.append(
             f"- A/M/D: {len(added_files)}/{len(modified_files)}/{len(deleted_files)}"
         )
@@ -359,29 +449,34 @@ class CommitMessageGenerator:
             return []
 
         parts = ["\nChanges (notes):"]
+        notes_by_path = self._per_file_notes_batch(files, cached=cached)
         for p in files:
             a, d = numstat_map.get(p, (0, 0))
-            notes = self._per_file_notes(p, cached=cached)
+            notes = notes_by_path.get(p, [])
             if notes:
                 parts.append(f"- {p} (+{a}/-{d}): {'; '.join(notes)}")
             else:
                 parts.append(f"- {p} (+{a}/-{d}): update")
         return parts
 
+    _IMPLEMENTATION_NOTES = (
+        "\nImplementation notes (heuristics):\n"
+        "- Type inferred from file paths + diff keywords + add/delete ratio\n"
+        "- Scope prefers 'goal' when goal/* is touched; otherwise based on top-level dirs\n"
+        "- For <=6 files: generate short per-file notes from added lines (defs/classes/click options/headings)\n"
+        "- A/M/D derived from git name-status; per-file +X/-X from git numstat"
+    )
+
     def _build_implementation_notes(self) -> List[str]:
         """Build implementation notes section."""
-        return [
-            "\nImplementation notes (heuristics):",
-            "- Type inferred from file paths + diff keywords + add/delete ratio",
-            "- Scope prefers 'goal' when goal/* is touched; otherwise based on top-level dirs",
-            "- For <=6 files: generate short per-file notes from added lines (defs/classes/click options/headings)",
-            "- A/M/D derived from git name-status; per-file +X/-X from git numstat",
-        ]
+        return [self._IMPLEMENTATION_NOTES]
 
     def generate_detailed_message(
         self, cached: bool = True, paths: Optional[List[str]] = None
     ) -> Dict[str, str]:
         """Generate a detailed commit message with body."""
+        self._prime_caches(cached, paths)
+
         # Try enhanced summary first if available
         enhanced_result = self._try_enhanced_summary(cached, paths)
         if enhanced_result:
@@ -403,23 +498,24 @@ class CommitMessageGenerator:
         )
         symbols = self.extract_functions_changed(diff_content)
 
-        # Build body with file details
-        body_parts = []
-        body_parts.append(self._build_statistics_section(stats))
-        body_parts.extend(
+        # Build body with file details, one line per section entry
+        body = io.StringIO()
+        body.write(self._build_statistics_section(stats))
+        for section in (
             self._build_summary_section(
                 files, added_files, modified_files, deleted_files, symbols
-            )
-        )
-        body_parts.extend(
+            ),
             self._build_file_lists(
                 added_files, modified_files, deleted_files, numstat_map
-            )
-        )
-        body_parts.extend(self._build_per_file_notes(files, numstat_map, cached))
-        body_parts.extend(self._build_implementation_notes())
-
-        return {"title": main_msg, "body": "\n".join(body_parts)}
+            ),
+            self._build_per_file_notes(files, numstat_map, cached),
+            self._build_implementation_notes(),
+        ):
+            for line in section:
+                body.write("\n")
+                body.write(line)
+
+        return {"title": main_msg, "body": body.getvalue()}
 
 
 # Convenience function for direct usage
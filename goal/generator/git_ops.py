@@ -1,47 +1,328 @@
 """Git operations for commit message generation - extracted from commit_generator.py."""
 
+import hashlib
+import os
+import pickle
 import subprocess
-from typing import Dict, List, Tuple, Optional
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple, Optional
+
+# Sub-directory of the git dir holding persisted staged-diff query results.
+DISK_CACHE_DIRNAME = "goal-cache"
+
+# Upper bound (in characters) of diff text kept for analysis; larger diffs
+# are cut at a line boundary and git is stopped instead of read to the end.
+DIFF_CONTENT_LIMIT = 256 * 1024
+
+_MISS = object()
+
+# Prepended to every git call: read-only queries never take the optional
+# index lock (no racy index refresh write-back), preload the index with
+# threads and never kick off an automatic gc.
+_GIT_OPTIONS = (
+    "--no-optional-locks",
+    "-c",
+    "core.preloadindex=true",
+    "-c",
+    "gc.auto=0",
+)
+
+# Environment that only changes how git talks to a terminal; output is
+# parsed, so pagers and translated messages are dropped.
+_GIT_ENV_DROP = ("GIT_PAGER", "PAGER", "LESS", "LANG", "LANGUAGE")
+
+
+def _git_env() -> Dict[str, str]:
+    env = {
+        k: v
+        for k, v in os.environ.items()
+        if k not in _GIT_ENV_DROP and not k.startswith("LC_")
+    }
+    env["GIT_OPTIONAL_LOCKS"] = "0"
+    env["LC_ALL"] = "C"
+    return env
+
+
+def _git_argv(
+    *args: str, cached: bool = False, paths: Optional[List[str]] = None
+) -> List[str]:
+    """Build a git command line; ``--cached`` and ``-- paths`` go last."""
+    argv = ["git", *_GIT_OPTIONS, *args]
+    if cached:
+        argv.append("--cached")
+    if paths:
+        argv.append("--")
+        argv.extend(paths)
+    return argv
+
+
+def _git(
+    *args: str,
+    cached: bool = False,
+    paths: Optional[List[str]] = None,
+    text: bool = True,
+) -> subprocess.CompletedProcess:
+    """Run a read-only git query and capture its output."""
+    return subprocess.run(
+        _git_argv(*args, cached=cached, paths=paths),
+        capture_output=True,
+        text=text,
+        env=_git_env(),
+        check=False,
+    )
+
+
+def _index_digest(git_dir: Path) -> bytes:
+    """Return an identity for the index content (empty when there is none).
+
+    Git stores a SHA-1 of the index in its trailing 20 bytes; it is only
+    zeroed when ``index.skipHash`` is set, in which case hash the file.
+    """
+    try:
+        with open(git_dir / "index", "rb") as fh:
+            fh.seek(-20, os.SEEK_END)
+            trailer = fh.read(20)
+            if trailer.strip(b"\0"):
+                return trailer
+            fh.seek(0)
+            return hashlib.sha1(fh.read()).digest()
+    except OSError:
+        return b""
+
+
+def _sum_numstat(output: bytes) -> Dict[str, int]:
+    """Total ``git diff --numstat`` output without decoding it.
+
+    Each record is split with two ``bytes.partition`` calls; binary files
+    report ``-`` for both counts and add nothing. Paths are never decoded.
+    """
+    files = added = deleted = 0
+    for line in output.splitlines():
+        adds, _, rest = line.partition(b"\t")
+        dels, sep, _ = rest.partition(b"\t")
+        if not sep:
+            continue
+        files += 1
+        if adds != b"-":
+            added += int(adds)
+        if dels != b"-":
+            deleted += int(dels)
+    return {"files": files, "added": added, "deleted": deleted}
+
+
+def _parse_raw_numstat(
+    output: str,
+) -> Tuple[List[Tuple[str, str]], Dict[str, Tuple[int, int]]]:
+    """Parse ``git diff --raw --numstat -z`` output.
+
+    Returns ``(name_status, numstat_map)``. Renames/copies are keyed by
+    their destination path in both structures.
+    """
+    name_status: List[Tuple[str, str]] = []
+    numstat: Dict[str, Tuple[int, int]] = {}
+    tokens = iter(output.split("\0"))
+    for token in tokens:
+        if not token:
+            continue
+        if token.startswith(":"):
+            # :<mode> <mode> <sha> <sha> <status>\0<path>[\0<dest>]
+            status = token.rsplit(" ", 1)[-1]
+            path = next(tokens, "")
+            if status[:1] in ("R", "C"):
+                path = next(tokens, path)
+            if path:
+                name_status.append((status, path))
+            continue
+        parts = token.split("\t", 2)
+        if len(parts) != 3:
+            continue
+        added = int(parts[0]) if parts[0] != "-" else 0
+        deleted = int(parts[1]) if parts[1] != "-" else 0
+        path = parts[2]
+        if not path:
+            # Rename/copy: empty path, then <src>\0<dest>
+            next(tokens, "")
+            path = next(tokens, "")
+        if path:
+            numstat[path] = (added, deleted)
+    return name_status, numstat
 
 
 class GitDiffOperations:
     """Git diff operations with caching."""
 
-    def __init__(self):
-        self.cache = {}
+    def __init__(self, disk_cache: bool = True, lru_cache_size: int = 8):
+        self.cache: "OrderedDict[str, Any]" = OrderedDict()
+        self.lru_cache_size = lru_cache_size
+        self.disk_cache = disk_cache
+        self._disk_state: Optional[Tuple[Path, str]] = None
+        self._disk_state_resolved = False
+        # Queries may be issued from several threads at once (see
+        # CommitMessageGenerator._prime_caches); the LRU and the lazily
+        # resolved HEAD are guarded by this lock.
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Cache layers: in-memory dict first, then .git/goal-cache/ for
+    # ``cached=True`` queries (the staged diff is fully determined by HEAD
+    # and the index, so those results survive across goal invocations).
+    # ------------------------------------------------------------------
+
+    def _resolve_disk_state(self) -> Optional[Tuple[Path, str]]:
+        """Return ``(cache_dir, snapshot_id)`` for the staged snapshot, or None."""
+        with self._lock:
+            if not self._disk_state_resolved:
+                self._disk_state_resolved = True
+                try:
+                    result = _git("rev-parse", "--git-dir", "HEAD")
+                except Exception:
+                    return None
+                lines = result.stdout.split()
+                if result.returncode != 0 or len(lines) != 2:
+                    return None
+                self._disk_state = (Path(lines[0]), lines[1])
+
+        if not self._disk_state:
+            return None
+        git_dir, head = self._disk_state
+        snapshot = hashlib.sha1(head.encode() + _index_digest(git_dir)).hexdigest()
+        return git_dir / DISK_CACHE_DIRNAME, snapshot[:16]
+
+    def _disk_path(self, cache_key: str) -> Optional[Path]:
+        state = self._resolve_disk_state()
+        if state is None:
+            return None
+        cache_dir, snapshot = state
+        name = hashlib.sha1(cache_key.encode()).hexdigest()[:16]
+        return cache_dir / f"{snapshot}-{name}.pkl"
+
+    def _cache_get(self, cache_key: str, cached: bool) -> Any:
+        """Return a cached value or ``_MISS``."""
+        with self._lock:
+            if cache_key in self.cache:
+                self.cache.move_to_end(cache_key)
+                return self.cache[cache_key]
+        if not (cached and self.disk_cache):
+            return _MISS
+        path = self._disk_path(cache_key)
+        if path is None:
+            return _MISS
+        try:
+            with open(path, "rb") as fh:
+                value = pickle.load(fh)
+        except Exception:
+            return _MISS
+        self._remember(cache_key, value)
+        return value
+
+    def _remember(self, cache_key: str, value: Any) -> None:
+        """Store ``value`` in memory, evicting down to ``lru_cache_size`` entries.
+
+        Full diff texts dominate memory, so the oldest of those is dropped
+        before any of the small name/stat entries.
+        """
+        with self._lock:
+            self.cache[cache_key] = value
+            self.cache.move_to_end(cache_key)
+            while len(self.cache) > self.lru_cache_size:
+                victim = next(
+                    (
+                        k
+                        for k in self.cache
+                        if k.startswith("diff_content_") and k != cache_key
+                    ),
+                    None,
+                )
+                if victim is None:
+                    self.cache.popitem(last=False)
+                else:
+                    del self.cache[victim]
+
+    def _cache_set(self, cache_key: str, value: Any, cached: bool) -> None:
+        self._remember(cache_key, value)
+        if not (cached and self.disk_cache):
+            return
+        path = self._disk_path(cache_key)
+        if path is None:
+            return
+        snapshot = path.name.split("-", 1)[0]
+        try:
+            path.parent.mkdir(exist_ok=True)
+            # Keep only the current snapshot; older ones can never match again.
+            for stale in path.parent.iterdir():
+                if not stale.name.startswith(snapshot):
+                    stale.unlink(missing_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "wb") as fh:
+                pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception:
+            pass
+
+    def prime_caches(
+        self, cached: bool = True, paths: Optional[List[str]] = None
+    ) -> None:
+        """Populate name-status, numstat, changed-files and stats caches."""
+        self._get_status_and_numstat(cached, paths)
+
+    def _get_status_and_numstat(
+        self, cached: bool = True, paths: Optional[List[str]] = None
+    ) -> Tuple[List[Tuple[str, str]], Dict[str, Tuple[int, int]]]:
+        """Return ``(name_status, numstat_map)`` from one shared git call.
+
+        A single ``git diff --raw --numstat -z`` replaces the separate
+        ``--name-status``, ``--numstat`` and ``--name-only`` invocations;
+        the changed-files list and (unnarrowed) stats are cached alongside.
+        """
+        paths_key = ",".join(paths) if paths else "*"
+        keys = (
+            f"name_status_{cached}_{paths_key}",
+            f"numstat_map_{cached}_{paths_key}",
+            f"changed_files_{cached}_{paths_key}",
+        )
+        hits = [self._cache_get(k, cached) for k in keys]
+        if all(hit is not _MISS for hit in hits):
+            return hits[0], hits[1]
+
+        try:
+            result = _git(
+                "diff", "--raw", "--numstat", "-z", cached=cached, paths=paths
+            )
+        except Exception:
+            return [], {}
+        if result.returncode != 0:
+            return [], {}
+
+        name_status, numstat = _parse_raw_numstat(result.stdout)
+        self._cache_set(keys[0], name_status, cached)
+        self._cache_set(keys[1], numstat, cached)
+        self._cache_set(keys[2], [p for _, p in name_status], cached)
+
+        # Whole-diff stats are only derivable when the diff was not narrowed.
+        if not paths:
+            stats = {
+                "files": len(numstat),
+                "added": sum(a for a, _ in numstat.values()),
+                "deleted": sum(d for _, d in numstat.values()),
+            }
+            self._cache_set(f"diff_stats_{cached}", stats, cached)
+        return name_status, numstat
 
     def get_diff_stats(self, cached: bool = True) -> Dict[str, int]:
         """Get diff statistics using git command."""
         cache_key = f"diff_stats_{cached}"
 
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        hit = self._cache_get(cache_key, cached)
+        if hit is not _MISS:
+            return hit
 
         try:
-            if cached:
-                result = subprocess.run(
-                    ["git", "diff", "--cached", "--numstat"],
-                    capture_output=True,
-                    text=True,
-                )
-            else:
-                result = subprocess.run(
-                    ["git", "diff", "--numstat"], capture_output=True, text=True
-                )
+            result = _git("diff", "--numstat", cached=cached, text=False)
 
-            stats = {"files": 0, "added": 0, "deleted": 0}
-
-            for line in result.stdout.strip().split("\n"):
-                if line:
-                    parts = line.split("\t")
-                    if len(parts) >= 2:
-                        added = int(parts[0]) if parts[0] != "-" else 0
-                        deleted = int(parts[1]) if parts[1] != "-" else 0
-                        stats["files"] += 1
-                        stats["added"] += added
-                        stats["deleted"] += deleted
-
-            self.cache[cache_key] = stats
+            stats = _sum_numstat(result.stdout)
+            self._cache_set(cache_key, stats, cached)
             return stats
 
         except Exception:
@@ -51,70 +332,13 @@ class GitDiffOperations:
         self, cached: bool = True, paths: Optional[List[str]] = None
     ) -> List[Tuple[str, str]]:
         """Return list of (status, path) from git diff --name-status."""
-        paths_key = ",".join(paths) if paths else "*"
-        cache_key = f"name_status_{cached}_{paths_key}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-
-        cmd = ["git", "diff"]
-        if cached:
-            cmd.append("--cached")
-        cmd.append("--name-status")
-        if paths:
-            cmd.append("--")
-            cmd.extend(paths)
-
-        items: List[Tuple[str, str]] = []
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            for line in result.stdout.splitlines():
-                if not line.strip():
-                    continue
-                parts = line.split("\t")
-                if len(parts) >= 2:
-                    status = parts[0].strip()
-                    path = parts[-1].strip()
-                    items.append((status, path))
-        except Exception:
-            items = []
-
-        self.cache[cache_key] = items
-        return items
+        return self._get_status_and_numstat(cached, paths)[0]
 
     def get_numstat_map(
         self, cached: bool = True, paths: Optional[List[str]] = None
     ) -> Dict[str, Tuple[int, int]]:
         """Return map path -> (added, deleted) from git diff --numstat."""
-        paths_key = ",".join(paths) if paths else "*"
-        cache_key = f"numstat_map_{cached}_{paths_key}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-
-        cmd = ["git", "diff"]
-        if cached:
-            cmd.append("--cached")
-        cmd.append("--numstat")
-        if paths:
-            cmd.append("--")
-            cmd.extend(paths)
-
-        out: Dict[str, Tuple[int, int]] = {}
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            for line in result.stdout.splitlines():
-                if not line.strip():
-                    continue
-                parts = line.split("\t")
-                if len(parts) >= 3:
-                    a = int(parts[0]) if parts[0] != "-" else 0
-                    d = int(parts[1]) if parts[1] != "-" else 0
-                    f = parts[2]
-                    out[f] = (a, d)
-        except Exception:
-            out = {}
-
-        self.cache[cache_key] = out
-        return out
+        return self._get_status_and_numstat(cached, paths)[1]
 
     def get_changed_files(
         self, cached: bool = True, paths: Optional[List[str]] = None
@@ -123,21 +347,15 @@ class GitDiffOperations:
         paths_key = ",".join(paths) if paths else "*"
         cache_key = f"changed_files_{cached}_{paths_key}"
 
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        hit = self._cache_get(cache_key, cached)
+        if hit is not _MISS:
+            return hit
 
         try:
-            cmd = ["git", "diff"]
-            if cached:
-                cmd.append("--cached")
-            cmd.append("--name-only")
-            if paths:
-                cmd.append("--")
-                cmd.extend(paths)
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = _git("diff", "--name-only", cached=cached, paths=paths)
 
             files = [f.strip() for f in result.stdout.strip().split("\n") if f.strip()]
-            self.cache[cache_key] = files
+            self._cache_set(cache_key, files, cached)
             return files
 
         except Exception:
@@ -150,28 +368,55 @@ class GitDiffOperations:
         paths_key = ",".join(paths) if paths else "*"
         cache_key = f"diff_content_{cached}_{paths_key}"
 
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        hit = self._cache_get(cache_key, cached)
+        if hit is not _MISS:
+            return hit
 
         try:
-            cmd = ["git", "diff"]
-            if cached:
-                cmd.append("--cached")
-            cmd.append("-U3")
-            if paths:
-                cmd.append("--")
-                cmd.extend(paths)
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            self.cache[cache_key] = result.stdout
-            return result.stdout
-
+            chunks: List[str] = []
+            size = 0
+            for line in self.iter_diff_lines(cached, paths):
+                chunks.append(line)
+                size += len(line)
+                if size >= DIFF_CONTENT_LIMIT:
+                    break
+            content = "".join(chunks)
         except Exception:
             return ""
 
+        self._cache_set(cache_key, content, cached)
+        return content
+
+    def iter_diff_lines(
+        self, cached: bool = True, paths: Optional[List[str]] = None
+    ) -> Iterator[str]:
+        """Yield ``git diff -U3`` output line by line while git produces it.
+
+        Closing the generator early terminates the git process.
+        """
+        proc = subprocess.Popen(
+            _git_argv("diff", "-U3", cached=cached, paths=paths),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=_git_env(),
+            text=True,
+            errors="replace",
+            bufsize=1,
+        )
+        try:
+            yield from proc.stdout
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+
     def clear_cache(self):
-        """Clear the operation cache."""
-        self.cache.clear()
+        """Clear the in-memory cache and forget the resolved HEAD."""
+        with self._lock:
+            self.cache.clear()
+            self._disk_state = None
+            self._disk_state_resolved = False
 
 
 __all__ = ["GitDiffOperations"]
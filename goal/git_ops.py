@@ -1,11 +1,18 @@
 """Git operations and interactive repository management."""
 
 import subprocess
+import locale
 import os
 import sys
 import re
+import selectors
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import click
 
 # Try to import clickmd for enhanced formatting
@@ -36,15 +43,300 @@ __all__ = [
 # =============================================================================
 
 
-def run_git(*args: str, capture: bool = True) -> subprocess.CompletedProcess:
-    """Run a git command and return the result."""
-    result = subprocess.run(["git"] + list(args), capture_output=capture, text=True)
+# posix_spawn skips subprocess's fork/close_fds machinery for the many tiny
+# captured git queries; other platforms keep using subprocess.run.
+HAS_POSIX_SPAWN = hasattr(os, "posix_spawnp")
+
+
+def _decode_output(data: bytes, errors: str = "strict") -> str:
+    """Decode captured output exactly like ``subprocess.run(text=True)``."""
+    encoding = "utf-8" if sys.flags.utf8_mode else locale.getpreferredencoding(False)
+    return data.decode(encoding, errors).replace("\r\n", "\n").replace("\r", "\n")
+
+
+# Variables that only shape git's terminal presentation; query output is
+# parsed, so pagers and translated messages are dropped.
+_GIT_ENV_DROP = ("GIT_PAGER", "PAGER", "LESS", "LANG", "LANGUAGE")
+
+
+def _git_env() -> Dict[str, str]:
+    """Environment for read-only git queries.
+
+    Locale initialisation is skipped (``LC_ALL=C``), optional index locks are
+    not taken and git never blocks on a terminal prompt. Everything else
+    (HOME, GIT_*, credentials, proxies) is inherited unchanged.
+    """
+    env = {
+        k: v
+        for k, v in os.environ.items()
+        if k not in _GIT_ENV_DROP and not k.startswith("LC_")
+    }
+    env["LC_ALL"] = "C"
+    env["GIT_OPTIONAL_LOCKS"] = "0"
+    env["GIT_TERMINAL_PROMPT"] = "0"
+    return env
+
+
+def _spawn_git(
+    args: Tuple[str, ...], env: Dict[str, str], text: bool = True
+) -> subprocess.CompletedProcess:
+    """Run ``git *args`` via ``posix_spawnp`` and capture stdout/stderr.
+
+    Output is decoded like ``text=True`` unless ``text`` is false, in which
+    case the raw bytes are returned.
+    """
+    argv = ["git", *args]
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    try:
+        # Pipes are non-inheritable; only the dup2'ed ends reach git.
+        pid = os.posix_spawnp(
+            "git",
+            argv,
+            env,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, out_w, 1),
+                (os.POSIX_SPAWN_DUP2, err_w, 2),
+            ],
+        )
+    except BaseException:
+        os.close(out_r)
+        os.close(err_r)
+        raise
+    finally:
+        os.close(out_w)
+        os.close(err_w)
+
+    chunks: Dict[int, List[bytes]] = {out_r: [], err_r: []}
+    with selectors.DefaultSelector() as sel:
+        sel.register(out_r, selectors.EVENT_READ)
+        sel.register(err_r, selectors.EVENT_READ)
+        while sel.get_map():
+            for key, _ in sel.select():
+                data = os.read(key.fd, 65536)
+                if data:
+                    chunks[key.fd].append(data)
+                else:
+                    sel.unregister(key.fd)
+                    os.close(key.fd)
+    _, status = os.waitpid(pid, 0)
+    stdout = b"".join(chunks[out_r])
+    stderr = b"".join(chunks[err_r])
+    if text:
+        stdout, stderr = _decode_output(stdout), _decode_output(stderr)
+    return subprocess.CompletedProcess(
+        args=argv,
+        returncode=os.waitstatus_to_exitcode(status),
+        stdout=stdout,
+        stderr=stderr,
+    )
+
+
+def _capture_git(
+    args: Tuple[str, ...], read_only: bool = False, text: bool = True
+) -> subprocess.CompletedProcess:
+    # Writes (commit, add, fetch...) may run hooks or prompt for
+    # credentials, so they keep the caller's environment.
+    env = _git_env() if read_only else dict(os.environ)
+    if HAS_POSIX_SPAWN:
+        return _spawn_git(args, env, text=text)
+    return subprocess.run(["git", *args], capture_output=True, text=text, env=env)
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+# rev-parse arguments answered from HEAD and the git dir layout alone, which
+# _GitSession._state watches; any other ref name makes the query uncached.
+_HEAD_REV_PARSE_ARGS = frozenset(
+    {
+        "HEAD",
+        "--abbrev-ref",
+        "--git-dir",
+        "--absolute-git-dir",
+        "--git-common-dir",
+        "--show-toplevel",
+        "--is-inside-work-tree",
+    }
+)
+
+# Commands that may write refs, the index or the config; run_git drops the
+# session after them rather than relying on the watched files alone.
+_MUTATING_COMMANDS = frozenset(
+    {
+        "add",
+        "am",
+        "branch",
+        "checkout",
+        "cherry-pick",
+        "clone",
+        "commit",
+        "config",
+        "fetch",
+        "filter-repo",
+        "init",
+        "merge",
+        "mv",
+        "pull",
+        "push",
+        "rebase",
+        "remote",
+        "reset",
+        "restore",
+        "revert",
+        "rm",
+        "stash",
+        "switch",
+        "tag",
+        "update-index",
+        "update-ref",
+    }
+)
+
+
+class _GitSession:
+    """Per-process memo of read-only git queries.
+
+    Only queries whose output is fully determined by HEAD, the index and the
+    repository config are cached (``diff --cached``, HEAD-relative
+    ``rev-parse`` forms, remote lookups). Each entry records the stat of
+    those files and is dropped as soon as any of them changes (git rewrites
+    the index and refs via rename, so a write always shows up as a new
+    inode/mtime). Other refs (loose tags, ``refs/remotes/*``) are not
+    watched, so ``rev-parse`` of anything but HEAD always runs git, and
+    :func:`run_git` clears the session after every mutating command.
+
+    This is what memoizes :func:`is_git_repository` (below the top level),
+    :func:`get_remote_branch`, :func:`get_remote_url` and
+    :func:`list_remotes` across one goal run.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._dirs: Dict[str, Tuple[Path, Path]] = {}
+        self._results: Dict[Tuple[str, Tuple[str, ...], bool], tuple] = {}
+
+    @staticmethod
+    def cacheable(args: Tuple[str, ...]) -> bool:
+        if not args:
+            return False
+        cmd = args[0]
+        if cmd == "diff":
+            return "--cached" in args or "--staged" in args
+        if cmd == "rev-parse":
+            return all(arg in _HEAD_REV_PARSE_ARGS for arg in args[1:])
+        if cmd == "remote":
+            return len(args) == 1 or args[1] in ("-v", "get-url")
+        return False
+
+    def _git_dirs(self, cwd: str) -> Optional[Tuple[Path, Path]]:
+        """Return ``(git_dir, common_dir)`` for ``cwd``; not cached when absent."""
+        dirs = self._dirs.get(cwd)
+        if dirs is None:
+            result = _capture_git(
+                ("rev-parse", "--absolute-git-dir", "--git-common-dir"), read_only=True
+            )
+            lines = result.stdout.splitlines()
+            if result.returncode != 0 or len(lines) != 2:
+                return None
+            # --git-common-dir is printed relative to the working directory.
+            dirs = (Path(lines[0]), Path(cwd, lines[1]))
+            self._dirs[cwd] = dirs
+        return dirs
+
+    def _state(self, cwd: str) -> Optional[tuple]:
+        dirs = self._git_dirs(cwd)
+        if dirs is None:
+            return None
+        git_dir, common_dir = dirs
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+        except OSError:
+            self._dirs.pop(cwd, None)
+            return None
+        watched = [git_dir / "index", common_dir / "config", common_dir / "packed-refs"]
+        if head.startswith("ref: "):
+            watched.append(common_dir / head[5:])
+        return (head, *(_stat_key(p) for p in watched))
+
+    def query(self, *args: str, text: bool = True) -> subprocess.CompletedProcess:
+        """Run a cacheable git query, reusing the last result while unchanged."""
+        cwd = os.getcwd()
+        key = (cwd, args, text)
+        with self._lock:
+            state = self._state(cwd)
+            cached = self._results.get(key)
+            if state is not None and cached is not None and cached[0] == state:
+                return cached[1]
+        result = _capture_git(args, read_only=True, text=text)
+        if state is not None:
+            with self._lock:
+                self._results[key] = (state, result)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dirs.clear()
+            self._results.clear()
+
+
+_session = _GitSession()
+
+
+def run_git(
+    *args: str, capture: bool = True, decode: bool = True
+) -> subprocess.CompletedProcess:
+    """Run a git command and return the result.
+
+    Captured read-only queries are served from :data:`_session` while HEAD,
+    the index and the config are unchanged; mutating commands clear it. With
+    ``decode=False`` captured stdout/stderr are returned as bytes, for
+    callers that only scan them.
+    """
+    if capture and _session.cacheable(args):
+        return _session.query(*args, text=decode)
+    if capture:
+        result = _capture_git(args, text=decode)
+    else:
+        result = subprocess.run(["git"] + list(args), capture_output=capture, text=True)
+    if args and args[0] in _MUTATING_COMMANDS:
+        _session.clear()
     return result
 
 
-def run_command(command: str, capture: bool = True) -> subprocess.CompletedProcess:
-    """Run a shell command and return the result."""
-    return subprocess.run(command, shell=True, capture_output=capture, text=True)
+def _run_git_many(
+    specs: Sequence[Tuple[str, ...]],
+) -> List[subprocess.CompletedProcess]:
+    """Run independent captured git queries concurrently, in ``specs`` order.
+
+    Each query is its own git process; only use this for reads, never for
+    commands that write the index or refs.
+    """
+    if len(specs) <= 1:
+        return [run_git(*spec) for spec in specs]
+    with ThreadPoolExecutor(max_workers=min(8, len(specs))) as pool:
+        return list(pool.map(lambda spec: run_git(*spec), specs))
+
+
+def run_command(
+    command: Union[str, Sequence[str]], capture: bool = True
+) -> subprocess.CompletedProcess:
+    """Run a command and return the result.
+
+    A string goes through the shell; an argv sequence is executed directly,
+    saving the shell process and any quoting of its arguments.
+    """
+    return subprocess.run(
+        command,
+        shell=isinstance(command, str),
+        capture_output=capture,
+        text=True,
+    )
 
 
 def _echo_cmd(args: List[str]) -> None:
@@ -131,26 +423,42 @@ def run_git_with_status(
     return result
 
 
-def run_command_tee(command: str) -> subprocess.CompletedProcess:
+def run_command_tee(command: Union[str, Sequence[str]]) -> subprocess.CompletedProcess:
+    """Run a command, echoing its output live while also capturing it.
+
+    As with run_command, only string commands go through the shell.
+    Output is forwarded in whatever blocks the pipe delivers rather than
+    line by line, so a chatty child costs one echo/flush per read instead
+    of one per line. Blocks are echoed as raw bytes and the captured output
+    is decoded once at the end.
+    """
     proc = subprocess.Popen(
         command,
-        shell=True,
+        shell=isinstance(command, str),
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
+        bufsize=0,
     )
 
-    output: List[str] = []
+    output: List[bytes] = []
     if proc.stdout is not None:
-        for chunk in proc.stdout:
-            output.append(chunk)
-            click.echo(chunk, nl=False)
-            sys.stdout.flush()
+        fd = proc.stdout.fileno()
+        try:
+            while True:
+                block = os.read(fd, 65536)
+                if not block:
+                    break
+                output.append(block)
+                click.echo(block, nl=False)
+        finally:
+            proc.stdout.close()
 
     returncode = proc.wait()
+    # The output was already shown, so undecodable bytes are replaced rather
+    # than failing the run after the fact.
+    stdout = _decode_output(b"".join(output), errors="replace")
     return subprocess.CompletedProcess(
-        args=command, returncode=returncode, stdout="".join(output), stderr=""
+        args=command, returncode=returncode, stdout=stdout, stderr=""
     )
 
 
@@ -160,26 +468,33 @@ def run_command_tee(command: str) -> subprocess.CompletedProcess:
 
 
 def is_git_repository() -> bool:
-    """Check if the current directory is inside a git repository."""
-    if Path(".git").exists():
-        return True
+    """Check if the current directory is inside a git repository.
+
+    Walks up from the working directory looking for ``.git`` (directory or
+    worktree file) without spawning git; git itself is only asked when
+    ``GIT_DIR`` overrides discovery or nothing was found (e.g. bare repos).
+    """
+    if not os.environ.get("GIT_DIR"):
+        path = Path.cwd()
+        for candidate in (path, *path.parents):
+            if (candidate / ".git").exists():
+                return True
     result = run_git("rev-parse", "--git-dir")
     return result.returncode == 0
 
 
+_REPO_URL_RE = re.compile(
+    r"^(?:"
+    r"git@[\w.\-]+:[\w.\-/]+(?:\.git)?"  # SSH format: git@host:user/repo.git
+    r"|https?://[\w.\-]+/[\w.\-/]+(?:\.git)?"  # HTTP(S) format
+    r"|file://.*"  # File protocol format
+    r")$"
+)
+
+
 def validate_repo_url(url: str) -> bool:
     """Validate that a URL looks like a git repository (HTTP/HTTPS/SSH/file)."""
-    url = url.strip()
-    # SSH format: git@host:user/repo.git
-    if re.match(r"^git@[\w.\-]+:[\w.\-/]+(?:\.git)?$", url):
-        return True
-    # HTTP(S) format
-    if re.match(r"^https?://[\w.\-]+/[\w.\-/]+(?:\.git)?$", url):
-        return True
-    # File protocol format
-    if re.match(r"^file://.*$", url):
-        return True
-    return False
+    return _REPO_URL_RE.match(url.strip()) is not None
 
 
 # =============================================================================
@@ -200,11 +515,12 @@ def list_remotes() -> List[Tuple[str, str]]:
     result = run_git("remote", "-v")
     if result.returncode != 0 or not result.stdout.strip():
         return []
-    seen = {}
-    for line in result.stdout.strip().splitlines():
-        parts = line.split()
-        if len(parts) >= 2 and parts[0] not in seen:
-            seen[parts[0]] = parts[1]
+    # "<name>\t<url> (fetch|push)": only the first two fields are needed.
+    seen: Dict[str, str] = {}
+    for line in result.stdout.splitlines():
+        parts = line.split(None, 2)
+        if len(parts) >= 2:
+            seen.setdefault(parts[0], parts[1])
     return list(seen.items())
 
 
@@ -235,13 +551,12 @@ def _list_remote_branches(remote: str = "origin") -> List[str]:
     result = run_git("ls-remote", "--heads", remote)
     if result.returncode != 0 or not result.stdout.strip():
         return []
+    prefix = "refs/heads/"
     branches = []
-    for line in result.stdout.strip().splitlines():
-        parts = line.split("\t")
-        if len(parts) == 2:
-            ref = parts[1]
-            branch = ref.replace("refs/heads/", "")
-            branches.append(branch)
+    for line in result.stdout.splitlines():
+        _, sep, ref = line.partition("\t")
+        if sep and ref.startswith(prefix):
+            branches.append(ref[len(prefix) :])
     return branches
 
 
@@ -475,7 +790,8 @@ def ensure_git_repository(auto: bool = False) -> bool:
         return False
 
     click.echo()
-    has_files = any(Path(".").iterdir())
+    with os.scandir(".") as entries:
+        has_files = next(entries, None) is not None
     cwd_name = Path(".").resolve().name
 
     action = click.prompt(
@@ -564,52 +880,173 @@ def ensure_remote(auto: bool = False) -> bool:
 # =============================================================================
 
 
+@dataclass
+class PushSnapshot:
+    """Staged files, their numstat counts and the branch a push starts on."""
+
+    files: List[str]
+    stats: Dict[str, Tuple[int, int]]
+    branch: str
+
+
+def gather_push_snapshot() -> PushSnapshot:
+    """Collect the staged file list, numstat and current branch in one batch.
+
+    The three read-only queries run concurrently; the getters then parse the
+    session-cached results. The branch is taken here, before committing,
+    because a new commit moves HEAD and would invalidate a later cached
+    ``rev-parse``.
+    """
+    _run_git_many(
+        [
+            ("diff", "--cached", "--name-only"),
+            ("diff", "--cached", "--numstat"),
+            ("rev-parse", "--abbrev-ref", "HEAD"),
+        ]
+    )
+    return PushSnapshot(
+        files=get_staged_files(), stats=get_diff_stats(), branch=get_remote_branch()
+    )
+
+
+# Parsed form of the last git result per getter. Staged queries come from
+# the session cache, which hands back the same CompletedProcess for as long
+# as HEAD and the index are unchanged, so identity means "same snapshot".
+_parse_cache: Dict[str, Tuple[object, object]] = {}
+
+
+def _parsed(key: str, result: subprocess.CompletedProcess, parse):
+    cached = _parse_cache.get(key)
+    if cached is not None and cached[0] is result:
+        return cached[1]
+    value = parse(result.stdout)
+    _parse_cache[key] = (result, value)
+    return value
+
+
+@dataclass
+class DiffSnapshot:
+    """Changed files and per-file line counts from a single numstat call."""
+
+    files: List[str] = field(default_factory=list)
+    stats: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+
+    @property
+    def lines_added(self) -> int:
+        return sum(a for a, _ in self.stats.values())
+
+    @property
+    def lines_deleted(self) -> int:
+        return sum(d for _, d in self.stats.values())
+
+
+def get_diff_snapshot(cached: bool = True) -> DiffSnapshot:
+    """Return staged (or unstaged) files and stats from one ``--numstat -z``.
+
+    Replaces a ``--name-only`` + ``--numstat`` pair. With ``-z`` renames are
+    reported by their destination path, matching ``--name-only``.
+    """
+    args = ["diff", "--numstat", "-z"]
+    if cached:
+        args.insert(1, "--cached")
+    snapshot = DiffSnapshot()
+    records = iter((run_git(*args).stdout or "").split("\0"))
+    for record in records:
+        adds, _, rest = record.partition("\t")
+        dels, sep, path = rest.partition("\t")
+        if not sep:
+            continue
+        if not path:
+            # Rename/copy: "<adds>\t<dels>\t\0<src>\0<dst>"
+            next(records, None)
+            path = next(records, "")
+        snapshot.files.append(path)
+        snapshot.stats[path] = (
+            0 if adds == "-" else int(adds),
+            0 if dels == "-" else int(dels),
+        )
+    return snapshot
+
+
 def get_staged_files() -> List[str]:
     """Get list of staged files."""
     result = run_git("diff", "--cached", "--name-only")
-    return result.stdout.strip().splitlines() if result.stdout.strip() else []
+    return list(_parsed("staged", result, _parse_lines))
 
 
-def get_unstaged_files() -> List[str]:
-    """Get list of unstaged/untracked files."""
-    result = run_git("status", "--porcelain")
-    return [line[3:] for line in result.stdout.strip().splitlines() if line]
+def _parse_lines(output: str) -> List[str]:
+    output = output.strip()
+    return output.splitlines() if output else []
 
 
-def get_working_tree_files() -> List[str]:
-    """Get list of files changed in working tree (unstaged + untracked)."""
-    changed = run_git("diff", "--name-only").stdout.strip().splitlines()
-    untracked = (
-        run_git("ls-files", "--others", "--exclude-standard")
-        .stdout.strip()
-        .splitlines()
-    )
+def get_unstaged_files() -> List[str]:
+    """Get list of unstaged/untracked files.
 
+    Parses NUL-separated ``status --porcelain -z`` records (``XY path``), so
+    paths with spaces or newlines survive and are never quoted; for renames
+    and copies the record is followed by the source path, which is skipped.
+    """
+    result = run_git("status", "--porcelain", "-z")
     files: List[str] = []
-    for f in [*changed, *untracked]:
-        f = (f or "").strip()
-        if not f:
+    records = iter((result.stdout or "").split("\0"))
+    for record in records:
+        if len(record) < 4:
             continue
-        if f not in files:
-            files.append(f)
+        files.append(record[3:])
+        if "R" in record[:2] or "C" in record[:2]:
+            next(records, None)
     return files
 
 
+# Space-separated fields preceding the path in ``status --porcelain=v2``
+# records: ordinary, rename/copy and unmerged entries.
+_PORCELAIN_V2_FIELDS = {"1": 8, "2": 9, "u": 10}
+
+
+def get_working_tree_files() -> List[str]:
+    """Get list of files changed in working tree (unstaged + untracked)."""
+    out = run_git("status", "--porcelain=v2", "-uall", "-z").stdout or ""
+
+    changed: List[str] = []
+    untracked: List[str] = []
+    records = iter(out.split("\0"))
+    for record in records:
+        kind = record[:1]
+        if kind == "?":
+            untracked.append(record[2:])
+            continue
+        fields = _PORCELAIN_V2_FIELDS.get(kind)
+        if fields is None:
+            continue
+        parts = record.split(" ", fields)
+        if kind == "2":
+            next(records, None)  # rename/copy source path
+        # Only entries with a worktree-side change (Y != '.') show up in
+        # ``git diff --name-only``; unmerged paths always do.
+        if len(parts) > fields and (kind == "u" or parts[1][1:] != "."):
+            changed.append(parts[fields])
+
+    return [f for f in dict.fromkeys(chain(changed, untracked)) if f]
+
+
 def get_diff_stats(cached: bool = True) -> Dict[str, Tuple[int, int]]:
     """Get additions/deletions per file."""
-    result = (
-        run_git("diff", "--cached", "--numstat")
-        if cached
-        else run_git("diff", "--numstat")
-    )
+    if not cached:
+        return _parse_numstat(run_git("diff", "--numstat").stdout)
+    result = run_git("diff", "--cached", "--numstat")
+    return dict(_parsed("numstat", result, _parse_numstat))
+
+
+def _parse_numstat(output: str) -> Dict[str, Tuple[int, int]]:
     stats = {}
-    for line in result.stdout.strip().splitlines():
-        if line:
-            parts = line.split("\t")
-            if len(parts) == 3:
-                adds = int(parts[0]) if parts[0] != "-" else 0
-                dels = int(parts[1]) if parts[1] != "-" else 0
-                stats[parts[2]] = (adds, dels)
+    for line in output.splitlines():
+        adds, _, rest = line.partition("\t")
+        dels, sep, path = rest.partition("\t")
+        if sep:
+            stats[path] = (
+                0 if adds == "-" else int(adds),
+                0 if dels == "-" else int(dels),
+            )
     return stats
 
 
@@ -636,13 +1073,11 @@ def get_diff_content(cached: bool = True, max_lines: int = 10000) -> str:
     return result.stdout
 
 
-def read_ticket(path: Path = Path("TICKET")) -> Dict[str, str]:
-    """Read TICKET configuration file (key=value)."""
+@lru_cache(maxsize=4)
+def _read_ticket_cached(path: str, stat_key: Tuple[int, int, int]) -> Dict[str, str]:
     cfg: Dict[str, str] = {"prefix": "", "format": "[{ticket}] {title}"}
-    if not path.exists():
-        return cfg
     try:
-        for raw in path.read_text().splitlines():
+        for raw in Path(path).read_text().splitlines():
             line = raw.strip()
             if not line or line.startswith("#"):
                 continue
@@ -655,6 +1090,18 @@ def read_ticket(path: Path = Path("TICKET")) -> Dict[str, str]:
     return cfg
 
 
+def read_ticket(path: Path = Path("TICKET")) -> Dict[str, str]:
+    """Read TICKET configuration file (key=value).
+
+    The parsed file is reused until its mtime/size/inode change, so
+    prefixing several titles in one run reads it once.
+    """
+    stat_key = _stat_key(path)
+    if stat_key is None:
+        return {"prefix": "", "format": "[{ticket}] {title}"}
+    return dict(_read_ticket_cached(os.path.abspath(path), stat_key))
+
+
 # Backward-compatible alias for the old typo name
 read_tickert = read_ticket
 
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from goal.toml_validation import read_pyproject
+
 
 @dataclass
 class InstallerConfig:
@@ -29,15 +31,11 @@ class InstallerConfig:
 
 def load_installer_config(project_dir: str = ".") -> InstallerConfig:
     """Load installer configuration from pyproject.toml."""
-    pyproject = Path(project_dir) / "pyproject.toml"
-    if not pyproject.exists():
+    data = read_pyproject(Path(project_dir))
+    if data is None:
         return InstallerConfig()
 
     try:
-        import tomllib
-
-        with open(pyproject, "rb") as f:
-            data = tomllib.load(f)
         cfg = data.get("tool", {}).get("goal", {}).get("installers", {})
         return InstallerConfig.from_dict(cfg)
     except Exception:
@@ -0,0 +1,50 @@
+"""Multi-keyword matching shared by the commit and summary analyzers."""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+# Optional C-accelerated multi-keyword matcher (pip install pyahocorasick)
+try:
+    import ahocorasick
+
+    HAS_AHOCORASICK = True
+except ImportError:
+    ahocorasick = None
+    HAS_AHOCORASICK = False
+
+# Pattern entries that are plain keywords once ``\.`` is unescaped.
+_LITERAL_PATTERN_RE = re.compile(r"(?:[\w/-]|\\\.)+")
+
+
+def split_literal_patterns(
+    patterns_by_type: Dict[str, List[str]],
+) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+    """Split a pattern table into ``(literal keywords, true regexes)`` per type."""
+    literals: Dict[str, List[str]] = {}
+    regexes: Dict[str, List[str]] = {}
+    for change_type, patterns in patterns_by_type.items():
+        for pattern in patterns:
+            if _LITERAL_PATTERN_RE.fullmatch(pattern):
+                literals.setdefault(change_type, []).append(pattern.replace("\\.", "."))
+            else:
+                regexes.setdefault(change_type, []).append(pattern)
+    return literals, regexes
+
+
+def build_keyword_automaton(literals_by_type: Dict[str, List[str]]) -> Any:
+    """Build an Aho-Corasick automaton mapping keyword -> (keyword, types).
+
+    Returns None when ``pyahocorasick`` is not installed.
+    """
+    if not HAS_AHOCORASICK:
+        return None
+    automaton = ahocorasick.Automaton()
+    for change_type, words in literals_by_type.items():
+        for word in words:
+            _, types = automaton.get(word, (word, ()))
+            automaton.add_word(word, (word, types + (change_type,)))
+    automaton.make_automaton()
+    return automaton
+
+
+__all__ = ["HAS_AHOCORASICK", "split_literal_patterns", "build_keyword_automaton"]
@@ -6,17 +6,20 @@ from typing import Dict, List, Any, Optional
 
 import click
 
-from goal.git_ops import run_git, get_staged_files, get_diff_content, get_diff_stats
+from goal.git_ops import (
+    run_git,
+    gather_push_snapshot,
+)
 from goal.project_bootstrap import detect_project_types_deep, bootstrap_project
 from goal.toml_validation import check_pyproject_toml
+from goal.cli_helpers import stage_paths
 from goal.push.stages import (
     get_commit_message,
     enforce_quality_gates,
     handle_single_commit,
     handle_split_commits,
-    handle_version_sync,
     get_version_info,
-    handle_changelog,
+    write_release_files,
     run_test_stage,
     create_tag,
     push_to_remote,
@@ -24,6 +27,7 @@ from goal.push.stages import (
     handle_dry_run,
     handle_todo_stage,
 )
+from goal.push.stages.commit import get_config_dict
 
 
 def run_git_local(*args, **kwargs) -> Any:
@@ -300,17 +304,20 @@ def execute_push_workflow(
     if not dry_run:
         run_git("add", "-A")
 
-    files = get_staged_files()
+    push_snapshot = gather_push_snapshot()
+    files = push_snapshot.files
     if _handle_no_files(ctx_obj, project_types, dry_run, markdown, files):
         return
 
     _validate_staged_files(ctx_obj, dry_run, force)
 
-    diff_content = get_diff_content()
-    stats = get_diff_stats()
+    # Per-file counts come from the numstat fetched in the startup batch
+    # (validation only ever aborts, it never restages); the generator reads
+    # the full diff itself only when it needs it, so it is not loaded here.
+    stats = push_snapshot.stats
 
     commit_title, commit_body, detailed_result = get_commit_message(
-        ctx_obj, files, diff_content, message, ticket, abstraction
+        ctx_obj, files, None, message, ticket, abstraction
     )
 
     if _abort_if_missing_commit_title(commit_title):
@@ -393,10 +400,7 @@ def execute_push_workflow(
 
     tag_name = create_tag(new_version, no_tag)
 
-    from goal.git_ops import get_remote_branch
-
-    branch = get_remote_branch()
-    push_to_remote(branch, tag_name, no_tag, ctx_obj["yes"])
+    push_to_remote(push_snapshot.branch, tag_name, no_tag, ctx_obj["yes"])
 
     elapsed = time.time() - start_time
     ctx_obj["_elapsed_time"] = elapsed
@@ -562,15 +566,22 @@ def _handle_commit_phase(
             ctx_obj["yes"],
         )
     else:
-        # Version sync
-        user_config = ctx_obj.get("user_config")
-        handle_version_sync(new_version, no_version_sync, user_config, ctx_obj["yes"])
-
-        # Changelog
-        config_dict = (
-            (ctx_obj.get("config") or {}).to_dict() if ctx_obj.get("config") else None
+        # Version sync and changelog, written side by side and staged at once
+        updated_files = write_release_files(
+            new_version,
+            files,
+            commit_msg,
+            get_config_dict(ctx_obj),
+            ctx_obj.get("user_config"),
+            no_version_sync,
+            no_changelog,
         )
-        handle_changelog(new_version, files, commit_msg, config_dict, no_changelog)
+        stage_paths(updated_files)
+        for f in updated_files:
+            if f == "CHANGELOG.md":
+                click.echo(click.style("✓ Updated CHANGELOG.md", fg="green"))
+            else:
+                click.echo(click.style(f"✓ Updated {f} to {new_version}", fg="green"))
 
         # Refresh costs README content before committing so the update is included.
         if _update_cost_badges(ctx_obj, new_version):
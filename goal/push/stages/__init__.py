@@ -6,7 +6,12 @@ from .commit import (
     handle_single_commit,
     handle_split_commits,
 )
-from .version import handle_version_sync, get_version_info, sync_all_versions_wrapper
+from .version import (
+    handle_version_sync,
+    get_version_info,
+    sync_all_versions_wrapper,
+    write_release_files,
+)
 from .changelog import handle_changelog, update_changelog_stage
 from .test import run_test_stage
 from .tag import create_tag
@@ -24,6 +29,7 @@ __all__ = [
     "handle_version_sync",
     "get_version_info",
     "sync_all_versions_wrapper",
+    "write_release_files",
     "handle_changelog",
     "update_changelog_stage",
     "run_test_stage",
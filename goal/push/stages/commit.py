@@ -11,20 +11,40 @@ from goal.enhanced_summary import QualityValidator
 from goal.cli_helpers import split_paths_by_type, stage_paths, confirm
 
 
+def get_config_dict(ctx_obj: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return ``ctx_obj["config"].to_dict()``, computed once per config object.
+
+    to_dict() deep-copies the whole configuration and push stages only read
+    it, so one copy is shared through ctx_obj for the rest of the run.
+    """
+    config_obj = ctx_obj.get("config")
+    if not config_obj:
+        return None
+    cached = ctx_obj.get("_config_dict")
+    if cached is not None and cached[0] is config_obj:
+        return cached[1]
+    config_dict = config_obj.to_dict()
+    ctx_obj["_config_dict"] = (config_obj, config_dict)
+    return config_dict
+
+
 def get_commit_message(
     ctx_obj: Dict[str, Any],
     files: List[str],
-    diff_content: str,
+    diff_content: Optional[str],
     message: Optional[str],
     ticket: Optional[str],
     abstraction: Optional[str],
 ) -> Tuple[Optional[str], Optional[str], Optional[Dict]]:
-    """Generate or use provided commit message."""
+    """Generate or use provided commit message.
+
+    ``diff_content`` is accepted for API compatibility; the generator reads
+    the staged diff through its own caches, so callers may pass ``None``.
+    """
     if message:
         return apply_ticket_prefix(message, ticket), None, None
 
-    config_obj = ctx_obj.get("config")
-    config_dict = config_obj.to_dict() if config_obj else None
+    config_dict = get_config_dict(ctx_obj)
     generator = CommitMessageGenerator(config=config_dict)
 
     use_enhanced = bool(
@@ -34,8 +54,20 @@ def get_commit_message(
         .get("enabled", False)
     )
 
+    # The enhanced branch and the final fallback both need the same detailed
+    # message; compute it at most once per call.
+    detailed_cache: Dict[Optional[Tuple[str, ...]], Any] = {}
+
+    def _detailed(paths: Optional[List[str]] = None) -> Any:
+        key = tuple(paths) if paths else None
+        if key not in detailed_cache:
+            detailed_cache[key] = generator.generate_detailed_message(
+                cached=True, paths=paths
+            )
+        return detailed_cache[key]
+
     if use_enhanced:
-        detailed = generator.generate_detailed_message(cached=True)
+        detailed = _detailed()
         if detailed and detailed.get("enhanced"):
             title = apply_ticket_prefix(detailed.get("title"), ticket)
             return title, detailed.get("body"), detailed
@@ -50,7 +82,7 @@ def get_commit_message(
             return title, abstraction_result.get("body"), None
 
     # Fallback to detailed message
-    detailed = generator.generate_detailed_message(cached=True)
+    detailed = _detailed()
     if detailed:
         title = apply_ticket_prefix(detailed.get("title"), ticket)
         return title, detailed.get("body"), detailed
@@ -102,8 +134,7 @@ def enforce_quality_gates(
     markdown: bool,
 ) -> str:
     """Enforce commit quality gates for auto-generated messages."""
-    config_obj = ctx_obj.get("config")
-    config_dict = config_obj.to_dict() if config_obj else {}
+    config_dict = get_config_dict(ctx_obj) or {}
     quality_cfg = (config_dict or {}).get("quality", {}).get("enhanced_summary", {})
 
     if not quality_cfg.get("enabled", True):
@@ -206,26 +237,19 @@ def _commit_release_metadata(
     """Sync versions, update changelog, update cost badges, and commit release metadata."""
     from ..core import _update_cost_badges
 
-    if not no_version_sync:
-        from .version import sync_all_versions_wrapper
+    from .version import write_release_files
 
-        stage_paths(sync_all_versions_wrapper(new_version, ctx_obj.get("user_config")))
-    else:
-        from pathlib import Path
-
-        Path("VERSION").write_text(f"{new_version}\n")
-        stage_paths(["VERSION"])
-
-    if not no_changelog:
-        from ...changelog import update_changelog
-
-        update_changelog(
+    stage_paths(
+        write_release_files(
             new_version,
             files,
             f"chore(release): bump version to {new_version}",
-            config=config_dict,
+            config_dict,
+            ctx_obj.get("user_config"),
+            no_version_sync,
+            no_changelog,
         )
-        stage_paths(["CHANGELOG.md"])
+    )
 
     if _update_cost_badges(ctx_obj, new_version):
         run_git("add", "README.md")
@@ -254,9 +278,7 @@ def handle_split_commits(
     yes: bool,
 ) -> None:
     """Handle split commits per file group."""
-    config_dict = (
-        (ctx_obj.get("config") or {}).to_dict() if ctx_obj.get("config") else None
-    )
+    config_dict = get_config_dict(ctx_obj)
     generator = CommitMessageGenerator(config=config_dict)
     groups = split_paths_by_type(files)
 
@@ -5,17 +5,16 @@ from typing import Any, Dict, Optional
 
 import click
 
+from goal.toml_validation import read_pyproject
+
 
 def _is_cost_tracking_enabled() -> bool:
     """Check pyproject.toml to see if cost badge/readme update is enabled."""
-    import tomllib
-
-    config_path = Path("pyproject.toml")
-    if not config_path.exists():
+    data = read_pyproject()
+    if data is None:
         return True
     try:
-        with open(config_path, "rb") as f:
-            tool_costs = tomllib.load(f).get("tool", {}).get("costs", {})
+        tool_costs = data.get("tool", {}).get("costs", {})
         return (
             tool_costs.get("badge") is not False
             or tool_costs.get("update_readme") is not False
@@ -7,6 +7,7 @@ import click
 from goal.cli import apply_ticket_prefix, split_paths_by_type
 from goal.commit_generator import CommitMessageGenerator
 from goal.formatter import format_enhanced_summary, format_push_result
+from goal.push.stages.commit import get_config_dict
 
 
 def _build_split_plan_body(
@@ -18,9 +19,7 @@ def _build_split_plan_body(
     no_changelog: bool,
 ) -> str:
     """Build commit body text describing the planned split commits."""
-    config_dict = (
-        (ctx_obj.get("config") or {}).to_dict() if ctx_obj.get("config") else None
-    )
+    config_dict = get_config_dict(ctx_obj)
     generator = CommitMessageGenerator(config=config_dict)
     groups = split_paths_by_type(files)
 
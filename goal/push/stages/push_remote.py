@@ -12,7 +12,6 @@ from goal.git_ops import (
     run_git,
     ensure_remote,
     run_git_with_status,
-    _echo_cmd,
     HAS_CLICKMD,
 )
 from goal.cli import confirm
@@ -39,12 +38,55 @@ def _print_push_header(branch: str, yes: bool) -> None:
         click.echo(click.style("🤖 AUTO: Pushing to remote (--all mode)", fg="cyan"))
 
 
-def _push_tag_if_needed(tag_name: Optional[str], no_tag: bool) -> None:
-    if tag_name and not no_tag:
-        _echo_cmd(["git", "push", "origin", tag_name])
-        result = run_git("push", "origin", tag_name, capture=False)
-        if result.returncode != 0:
-            click.echo(click.style(f"⚠  Could not push tag {tag_name}.", fg="yellow"))
+def _push_branch_and_tag(
+    branch: str, tag_name: Optional[str], no_tag: bool
+) -> subprocess.CompletedProcess:
+    """Push the branch and its release tag in one ``git push --atomic``.
+
+    If the tag itself was refused (already on the remote) or the server has
+    no atomic support, the branch is retried alone so a tag problem never
+    blocks the commits; the tag is then only reported as not pushed. Any
+    other failure (auth, network, non-fast-forward) is returned as is.
+    """
+    if not tag_name or no_tag:
+        return run_git_with_status(
+            "push", "origin", branch, capture=True, show_output=False
+        )
+
+    result = run_git_with_status(
+        "push",
+        "--atomic",
+        "origin",
+        branch,
+        tag_name,
+        capture=True,
+        show_output=False,
+    )
+    if result.returncode == 0 or not _tag_blocked_push(result.stderr, tag_name):
+        return result
+
+    result = run_git_with_status(
+        "push", "origin", branch, capture=True, show_output=False
+    )
+    if result.returncode == 0:
+        click.echo(click.style(f"⚠  Could not push tag {tag_name}.", fg="yellow"))
+    return result
+
+
+def _tag_blocked_push(stderr: Optional[str], tag_name: str) -> bool:
+    """Tell whether an atomic push failed because of the tag ref alone."""
+    if not stderr:
+        return False
+    if "does not support --atomic" in stderr:
+        return True
+    for line in stderr.splitlines():
+        if (
+            "rejected]" in line
+            and line.split(" -> ", 1)[-1].split(" ", 1)[0] == tag_name
+            and "atomic push failed" not in line
+        ):
+            return True
+    return False
 
 
 def _handle_push_failure(result, branch: str, yes: bool) -> bool:
@@ -97,14 +139,11 @@ def push_to_remote(
 
     try:
         _print_push_header(branch, yes)
-        result = run_git_with_status(
-            "push", "origin", branch, capture=True, show_output=False
-        )
+        result = _push_branch_and_tag(branch, tag_name, no_tag)
 
         if result.returncode != 0:
             return _handle_push_failure(result, branch, yes)
 
-        _push_tag_if_needed(tag_name, no_tag)
         click.echo(
             click.style(f"\n✓ Successfully pushed to {branch}", fg="green", bold=True)
         )
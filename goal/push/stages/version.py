@@ -1,10 +1,13 @@
 """Push workflow stages - version handling."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Dict
 
 import click
 
+from .changelog import update_changelog_stage
+
 
 def _get_version_module():
     """Lazy import version functions to avoid circular imports."""
@@ -21,6 +24,37 @@ def sync_all_versions_wrapper(
     return sync_all_versions(new_version, user_config)
 
 
+def write_release_files(
+    new_version: str,
+    files: List[str],
+    commit_msg: str,
+    config: Optional[Dict],
+    user_config: Optional[Dict],
+    no_version_sync: bool,
+    no_changelog: bool,
+) -> List[str]:
+    """Write version bumps and the changelog entry, returning paths to stage.
+
+    The two touch disjoint files, so the changelog is written on a worker
+    thread while versions sync; the caller stages everything in one go.
+    """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        changelog = None
+        if not no_changelog:
+            changelog = pool.submit(
+                update_changelog_stage, new_version, files, commit_msg, config
+            )
+        if no_version_sync:
+            Path("VERSION").write_text(new_version + "\n")
+            updated = ["VERSION"]
+        else:
+            updated = list(sync_all_versions_wrapper(new_version, user_config))
+        if changelog is not None:
+            changelog.result()
+            updated.append("CHANGELOG.md")
+    return updated
+
+
 def handle_version_sync(
     new_version: str, no_version_sync: bool, user_config: Optional[Dict], yes: bool
 ) -> None:
@@ -4,7 +4,7 @@ import os
 import re
 import subprocess
 import time
-from typing import List
+from typing import Dict, List
 import click
 
 from .base import RecoveryStrategy
@@ -252,22 +252,23 @@ class LargeFileStrategy(RecoveryStrategy):
             matches = re.findall(pattern, error_output, re.IGNORECASE)
             paths.extend(matches)
 
-        # Filter out invalid paths more strictly
-        valid_paths = []
+        # Filter out invalid paths more strictly; duplicates keep the
+        # position of their first mention in the error output
+        skip_words = {
+            "file",
+            "path",
+            "storage",
+            "size",
+            "mb",
+            "gb",
+            "git",
+            "lfs",
+            "large",
+            "filestorage",
+        }
+        valid_paths: Dict[str, None] = {}
         for path in paths:
             # Skip common non-file words and patterns
-            skip_words = [
-                "file",
-                "path",
-                "storage",
-                "size",
-                "mb",
-                "gb",
-                "git",
-                "lfs",
-                "large",
-                "filestorage",
-            ]
             if path.lower() in skip_words:
                 continue
 
@@ -279,9 +280,9 @@ class LargeFileStrategy(RecoveryStrategy):
             if len(path) < 3:
                 continue
 
-            valid_paths.append(path)
+            valid_paths.setdefault(path)
 
-        return list(set(valid_paths))  # Remove duplicates
+        return list(valid_paths)
 
     def _find_large_files(self, min_size_mb: int = 50) -> List[str]:
         """Find large files in the repository."""
@@ -35,9 +35,18 @@ class CodeAbstraction:
         self.abstraction_level = (
             config.get("git", {}).get("commit", {}).get("abstraction_level", "auto")
         )
+        # filepath -> domain; analyze_changes runs several times per commit
+        # (message, body, changelog entry) over the same staged files.
+        self._domain_cache: Dict[str, str] = {}
 
     def get_domain(self, filepath: str) -> str:
         """Map filepath to domain using goal.yaml domain_mapping."""
+        domain = self._domain_cache.get(filepath)
+        if domain is None:
+            domain = self._domain_cache[filepath] = self._match_domain(filepath)
+        return domain
+
+    def _match_domain(self, filepath: str) -> str:
         for pattern, domain in self.domain_mapping.items():
             if fnmatch.fnmatch(filepath, pattern):
                 return domain
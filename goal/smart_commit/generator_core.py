@@ -1,5 +1,6 @@
 """Smart commit generator — staged-file analysis pipeline."""
 
+import re
 import subprocess
 from collections import Counter, defaultdict
 from pathlib import Path
@@ -35,13 +36,16 @@ class SmartCommitGeneratorCore:
         """Populate analysis with per-file domain/diff info. Returns all extracted entities."""
         domain_counter: Counter = Counter()
         all_entities: List[str] = []
+        file_diffs = self._get_file_diffs()
 
         for filepath in staged_files:
             domain = self.abstraction.get_domain(filepath)
             domain_counter[domain] += 1
             analysis["domains"][domain].append(filepath)
 
-            diff = self._get_file_diff(filepath)
+            diff = file_diffs.get(filepath)
+            if diff is None:
+                diff = self._get_file_diff(filepath)
             if not diff:
                 continue
             for line in diff.split("\n"):
@@ -215,6 +219,33 @@ class SmartCommitGeneratorCore:
         except subprocess.CalledProcessError:
             return []
 
+    def _get_file_diffs(self) -> Dict[str, str]:
+        """Get the staged diff of every file from one ``git diff`` call.
+
+        ``--no-renames`` makes each section match what ``_get_file_diff``
+        returns for its path. Sections whose header does not name a plain
+        ``a/<path> b/<path>`` pair (quoted paths) are left out, so callers
+        fall back to the per-file query for them.
+        """
+        try:
+            result = subprocess.run(
+                ["git", "diff", "--cached", "--no-renames"],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except subprocess.CalledProcessError:
+            return {}
+
+        diffs: Dict[str, str] = {}
+        for section in re.split(r"(?m)^(?=diff --git )", result.stdout):
+            header, _, _ = section.partition("\n")
+            paths = header[len("diff --git a/") :]
+            half = (len(paths) - len(" b/")) // 2
+            if paths[half : half + 3] == " b/" and paths[:half] == paths[half + 3 :]:
+                diffs[paths[:half]] = section
+        return diffs
+
     def _get_file_diff(self, filepath: str) -> str:
         """Get diff content for a specific file."""
         try:
@@ -6,6 +6,7 @@ from collections import defaultdict
 from pathlib import Path
 
 from goal.deep_analyzer import CodeChangeAnalyzer
+from goal.keyword_match import build_keyword_automaton
 from goal.summary.quality_filter import SummaryQualityFilter
 from goal.summary.body_formatter import CommitBodyFormatter
 
@@ -97,6 +98,14 @@ class EnhancedSummaryGenerator:
         },
     }
 
+    # Lowercased signatures per capability, matched in one pass over the text
+    # (Aho-Corasick when pyahocorasick is installed).
+    _SIGNATURES = {
+        cap_id: [sig.lower() for sig in cap_info["signatures"]]
+        for cap_id, cap_info in VALUE_PATTERNS.items()
+    }
+    _SIGNATURE_AUTOMATON = build_keyword_automaton(_SIGNATURES)
+
     # Generic terms to avoid in summaries
     GENERIC_TERMS = {
         "update",
@@ -215,25 +224,31 @@ class EnhancedSummaryGenerator:
         self, files: List[str], diff_content: str
     ) -> List[Dict[str, str]]:
         """Detect capabilities from files and diff content."""
-        capabilities = []
-        seen = set()
-
-        combined_text = f"{diff_content} {' '.join(files)}"
-
-        for cap_id, cap_info in self.VALUE_PATTERNS.items():
-            for sig in cap_info["signatures"]:
-                if sig.lower() in combined_text.lower() and cap_id not in seen:
-                    capabilities.append(
-                        {
-                            "id": cap_id,
-                            "capability": cap_info["capability"],
-                            "impact": cap_info["impact"],
-                        }
-                    )
-                    seen.add(cap_id)
+        combined_text = f"{diff_content} {' '.join(files)}".lower()
+
+        automaton = self._SIGNATURE_AUTOMATON
+        if automaton is not None:
+            found = set()
+            for _, (_sig, cap_ids) in automaton.iter(combined_text):
+                found.update(cap_ids)
+                if len(found) == len(self._SIGNATURES):
                     break
-
-        return capabilities
+        else:
+            found = {
+                cap_id
+                for cap_id, sigs in self._SIGNATURES.items()
+                if any(sig in combined_text for sig in sigs)
+            }
+
+        return [
+            {
+                "id": cap_id,
+                "capability": cap_info["capability"],
+                "impact": cap_info["impact"],
+            }
+            for cap_id, cap_info in self.VALUE_PATTERNS.items()
+            if cap_id in found
+        ]
 
     def detect_file_relations(
         self, files: List[str], diff_content: str = ""
@@ -75,6 +75,16 @@ class SummaryQualityFilter:
         "quality": [r"quality", r"metric", r"coverage", r"dependen"],
     }
 
+    # Extension fallback when no domain pattern matches (lowercased, no dot)
+    FALLBACK_EXT_CATEGORIES = {
+        "md": "docs",
+        "yaml": "config",
+        "yml": "config",
+        "toml": "config",
+        "json": "config",
+        "ini": "config",
+    }
+
     # Intent classification patterns
     REFACTOR_PATTERNS = [
         r"analyzer",
@@ -117,6 +127,11 @@ class SummaryQualityFilter:
         ]
         self._feat_re = [re.compile(p, re.IGNORECASE) for p in self.FEAT_PATTERNS]
         self._fix_re = [re.compile(p, re.IGNORECASE) for p in self.FIX_PATTERNS]
+        # One alternation per domain, tried in DOMAIN_PATTERNS order
+        self._domain_re = [
+            (domain, re.compile("|".join(f"(?:{p})" for p in patterns)))
+            for domain, patterns in self.DOMAIN_PATTERNS.items()
+        ]
 
     def is_noise(self, entity_name: str, role: str = "") -> bool:
         """Check if entity should be filtered as noise."""
@@ -226,26 +241,19 @@ class SummaryQualityFilter:
 
         for f in files:
             fname = f.lower()
-            stem = Path(f).stem.lower()
-            matched = False
 
             # Try domain patterns first
-            for domain, patterns in self.DOMAIN_PATTERNS.items():
-                if any(re.search(p, fname) for p in patterns):
-                    categories[domain].append(f)
-                    matched = True
-                    break
-
-            if not matched:
-                # Fallback categorization
-                if fname.endswith(".md"):
-                    categories["docs"].append(f)
-                elif fname.endswith((".yaml", ".yml", ".toml", ".json", ".ini")):
-                    categories["config"].append(f)
-                elif "test" in fname:
-                    categories["test"].append(f)
-                else:
-                    categories["core"].append(f)
+            domain = next(
+                (domain for domain, regex in self._domain_re if regex.search(fname)),
+                None,
+            )
+            if domain is None:
+                # Fallback categorization by extension, then name
+                _, dot, ext = fname.rpartition(".")
+                domain = (dot and self.FALLBACK_EXT_CATEGORIES.get(ext)) or (
+                    "test" if "test" in fname else "core"
+                )
+            categories[domain].append(f)
 
         return {k: v for k, v in categories.items() if v}
 
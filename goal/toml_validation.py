@@ -1,22 +1,45 @@
 """TOML validation utilities for early error detection."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import tomllib as _tomllib
+except ModuleNotFoundError:
+    try:
+        import tomli as _tomllib
+    except ImportError:
+        _tomllib = None
 
 
 def get_tomllib():
-    """Get the best available TOML library."""
-    try:
-        import tomllib
+    """Get the best available TOML library (resolved once at import)."""
+    return _tomllib
+
+
+@lru_cache(maxsize=8)
+def parse_toml(content: str) -> Dict[str, Any]:
+    """``tomllib.loads`` memoized on the document text.
+
+    pyproject.toml is parsed by validation, publishing and push stages in
+    one run; identical text is parsed once. Treat the result as read-only.
+    """
+    return _tomllib.loads(content)
+
 
-        return tomllib
-    except ModuleNotFoundError:
-        try:
-            import tomli as tomllib
+def read_pyproject(project_dir: Path = Path(".")) -> Optional[Dict[str, Any]]:
+    """Return the parsed ``pyproject.toml`` of project_dir, or None.
 
-            return tomllib
-        except ImportError:
-            return None
+    None covers a missing file, invalid TOML and a missing TOML library.
+    """
+    if _tomllib is None:
+        return None
+    try:
+        content = (Path(project_dir) / "pyproject.toml").read_text(encoding="utf-8")
+        return parse_toml(content)
+    except (OSError, ValueError):
+        return None
 
 
 def validate_toml_file(filepath: Path) -> Tuple[bool, Optional[str]]:
@@ -41,7 +64,7 @@ def validate_toml_file(filepath: Path) -> Tuple[bool, Optional[str]]:
 
     try:
         if hasattr(tomllib, "loads"):
-            tomllib.loads(content)
+            parse_toml(content)
         return True, None
     except Exception as e:
         error_str = str(e)
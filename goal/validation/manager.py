@@ -6,7 +6,7 @@ from typing import Dict, Any, List, Optional
 import yaml
 import click
 
-from goal.git_ops import get_staged_files, get_diff_stats
+from goal.git_ops import get_diff_snapshot
 from .rules import AVAILABLE_RULES
 
 
@@ -47,9 +47,10 @@ class ValidationRuleManager:
         Returns:
             Dictionary with validation context
         """
+        snapshot = get_diff_snapshot()
         context = {
-            "files": get_staged_files(),
-            "stats": get_diff_stats(),
+            "files": snapshot.files,
+            "stats": snapshot.stats,
             "message": "",
             "hash": "",
         }
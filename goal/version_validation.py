@@ -6,9 +6,12 @@ import json
 import logging
 import urllib.request
 import urllib.error
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+from goal.toml_validation import get_tomllib, parse_toml
+
 logger = logging.getLogger(__name__)
 
 
@@ -143,12 +146,8 @@ def _detect_python_package() -> Optional[str]:
     if not pyproject_path.exists():
         return None
     try:
-        try:
-            import tomllib
-        except ModuleNotFoundError:
-            tomllib = None
-        if tomllib is not None:
-            data = tomllib.loads(pyproject_path.read_text())
+        if get_tomllib() is not None:
+            data = parse_toml(pyproject_path.read_text())
             return (data.get("project") or {}).get("name") or (
                 (data.get("tool") or {}).get("poetry") or {}
             ).get("name")
@@ -209,32 +208,46 @@ def _detect_ruby_package() -> Optional[str]:
 
 # Registry for each project type: (registry_name, detect_func_name, fetch_func_name, not_found_msg)
 # Uses function names (not references) so that unittest.mock.patch works correctly.
-_VERSION_VALIDATORS = {
-    "python": (
-        "pypi",
-        "_detect_python_package",
-        "get_pypi_version",
-        "Package not found in PyPI",
-    ),
-    "nodejs": (
-        "npm",
-        "_detect_nodejs_package",
-        "get_npm_version",
-        "Package not found in npm",
-    ),
-    "rust": (
-        "cargo",
-        "_detect_rust_package",
-        "get_cargo_version",
-        "Crate not found in crates.io",
-    ),
-    "ruby": (
-        "rubygems",
-        "_detect_ruby_package",
-        "get_rubygems_version",
-        "Gem not found in RubyGems",
-    ),
-}
+_VERSION_VALIDATORS = MappingProxyType(
+    {
+        "python": (
+            "pypi",
+            "_detect_python_package",
+            "get_pypi_version",
+            "Package not found in PyPI",
+        ),
+        "nodejs": (
+            "npm",
+            "_detect_nodejs_package",
+            "get_npm_version",
+            "Package not found in npm",
+        ),
+        "rust": (
+            "cargo",
+            "_detect_rust_package",
+            "get_cargo_version",
+            "Crate not found in crates.io",
+        ),
+        "ruby": (
+            "rubygems",
+            "_detect_ruby_package",
+            "get_rubygems_version",
+            "Gem not found in RubyGems",
+        ),
+    }
+)
+
+# Result of _validate_single_type for unknown types / undetected packages.
+_EMPTY_VALIDATION = MappingProxyType(
+    {
+        "registry": None,
+        "package_name": None,
+        "registry_version": None,
+        "local_version": None,
+        "is_latest": True,
+        "error": None,
+    }
+)
 
 import sys as _sys
 
@@ -245,14 +258,7 @@ def _validate_single_type(project_type: str, current_version: str) -> Dict:
     Returns a result dict with registry info, or defaults when the type
     is unknown / the package cannot be detected.
     """
-    result: Dict = {
-        "registry": None,
-        "package_name": None,
-        "registry_version": None,
-        "local_version": current_version,
-        "is_latest": True,
-        "error": None,
-    }
+    result: Dict = dict(_EMPTY_VALIDATION, local_version=current_version)
 
     entry = _VERSION_VALIDATORS.get(project_type)
     if not entry:
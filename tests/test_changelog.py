@@ -2,7 +2,7 @@
 
 import tempfile
 from pathlib import Path
-from goal.changelog import update_changelog
+from goal.changelog import _DomainRules, update_changelog
 
 
 def test_update_changelog_creates_new_file():
@@ -134,3 +134,55 @@ Initial release.
             assert "1.0.0" in content
         finally:
             os.chdir(old_cwd)
+
+
+def test_update_changelog_keeps_long_tail_and_mode():
+    """Older releases are copied through verbatim and the file mode is kept."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        import os
+
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_dir)
+            tail = "".join(
+                f"## [0.{i}.0] - 2024-01-01\n\n- change {i}\n\n" for i in range(2000)
+            )
+            Path("CHANGELOG.md").write_text(f"# Changelog\n\n## [Unreleased]\n\n{tail}")
+            os.chmod("CHANGELOG.md", 0o644)
+
+            update_changelog("1.0.0", ["a.py"], "feat: a")
+
+            content = Path("CHANGELOG.md").read_text()
+            assert content.startswith("# Changelog\n\n## [Unreleased]\n\n## [1.0.0]")
+            assert content.endswith(tail)
+            assert os.stat("CHANGELOG.md").st_mode & 0o777 == 0o644
+            assert os.listdir(".") == ["CHANGELOG.md"]
+        finally:
+            os.chdir(old_cwd)
+
+
+def test_domain_rules_keep_first_match_priority():
+    """Prefix lookups never outrank an earlier glob in domain_mapping."""
+    rules = _DomainRules(
+        {
+            "*.md": "docs",
+            "src/*": "feat",
+            "src/legacy/**": "refactor",
+            "tests/*": "test",
+            "*/fixtures/*": "chore",
+        }
+    )
+    assert rules.classify("src/README.md") == "docs"
+    assert rules.classify("src/legacy/old.py") == "feat"
+    assert rules.classify("tests/unit/test_a.py") == "test"
+    assert rules.classify("pkg/fixtures/data.json") == "chore"
+    assert rules.classify("setup.py") == "other"
+
+
+def test_domain_rules_match_extension_patterns():
+    """``*.ext`` rules need a real extension and still respect priority."""
+    rules = _DomainRules({"src/*": "feat", "*.py": "fix", "*.tar.gz": "chore"})
+    assert rules.classify("src/app.py") == "feat"
+    assert rules.classify("tools/run.py") == "fix"
+    assert rules.classify("py") == "other"
+    assert rules.classify("dist/pkg.tar.gz") == "chore"
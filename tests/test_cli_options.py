@@ -137,3 +137,19 @@ def test_warn_goal_binary_mismatch_prefers_local_goal_binary_hint(
     out = capsys.readouterr().out
     assert "Prefer:" in out
     assert ".venv/bin/goal" in out
+
+
+def test_validate_command_loads_quality_validator() -> None:
+    from goal.cli import commit_cmd
+    from goal.git_ops import DiffSnapshot
+
+    snapshot = DiffSnapshot(files=["a.py"], stats={"a.py": (1, 0)})
+    detailed = {"title": "feat: add a", "body": "", "intent": "feat"}
+    with mock.patch.object(
+        commit_cmd, "get_diff_snapshot", return_value=snapshot
+    ), mock.patch.object(commit_cmd, "CommitMessageGenerator") as generator_cls:
+        generator_cls.return_value.generate_detailed_message.return_value = detailed
+        res = CliRunner().invoke(commit_cmd.validate, [], obj={})
+
+    assert res.exception is None, res.output
+    assert "Quality Score:" in res.output
@@ -37,6 +37,30 @@ def test_find_python_test_dirs_deduplicates_project_roots_and_prefers_tests_dir(
     assert set(dirs) == {"svc_a/tests", "svc_b"}
 
 
+def test_find_python_test_dirs_probes_each_directory_once(tmp_path, monkeypatch):
+    svc = tmp_path / "svc"
+    (svc / "tests" / "unit").mkdir(parents=True)
+    (svc / "pyproject.toml").write_text('[project]\nname="svc"\nversion="0.1.0"\n')
+    for i in range(20):
+        (svc / "tests" / "unit" / f"test_{i}.py").write_text("")
+
+    from goal.cli import tests_discovery
+
+    real_marker = tests_discovery._has_project_marker
+    probed = []
+
+    def spy(project_dir, marker):
+        probed.append((project_dir, marker))
+        return real_marker(project_dir, marker)
+
+    monkeypatch.chdir(tmp_path)
+    with patch.object(tests_discovery, "_has_project_marker", side_effect=spy):
+        dirs = cli_tests._find_python_test_dirs()
+
+    assert dirs == ["svc/tests"]
+    assert len(probed) == len(set(probed))
+
+
 def test_resolve_project_python_returns_absolute_project_python():
     with patch(
         "goal.cli.tests._find_python_bin", return_value="svc_a/.venv/bin/python"
@@ -0,0 +1,86 @@
+"""Tests for goal/generator/analyzer.py."""
+
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+
+from goal.generator.analyzer import ChangeAnalyzer, ContentAnalyzer
+
+
+def _git(*args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_per_file_notes_batch_handles_paths_with_spaces():
+    """Batched notes match per-file notes for a path containing a space."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_dir)
+            _git("init", "-q")
+            Path("a b.py").write_text("def foo():\n    return 1\n")
+            Path("c.py").write_text("def bar():\n    return 2\n")
+            _git("add", "-A")
+
+            analyzer = ContentAnalyzer()
+            batch = analyzer.per_file_notes_batch(["a b.py", "c.py"])
+            assert batch["a b.py"] == analyzer.per_file_notes("a b.py")
+            assert batch["a b.py"] == ["add functions: foo"]
+            assert batch["c.py"] == ["add functions: bar"]
+        finally:
+            os.chdir(old_cwd)
+
+
+def test_classify_change_type_breaks_ties_in_pattern_order(monkeypatch):
+    """Tied scores resolve the way the per-pattern scan ordered them."""
+    monkeypatch.setattr(ChangeAnalyzer, "_KEYWORD_AUTOMATON", None)
+    files = ["examples/fix.md", "cli.md", "pkg/test_a"]
+    diff = "src/\ndocs/\n_test.py src/ _test.py"
+    stats = {"files": 3, "added": 10, "deleted": 1}
+    assert ChangeAnalyzer().classify_change_type(files, diff, stats) == "docs"
+
+
+def test_classify_change_type_same_with_and_without_automaton(monkeypatch):
+    """The Aho-Corasick path and the str fallback classify identically."""
+    cases = [
+        (["docfeatreorganize", "test"], "improve", 2, 16, 8),
+        (["whitespacecompile"], "new rename fast src/", 1, 19, 15),
+        (["examples/fix.md", "cli.md", "pkg/test_a"], "src/ _test.py", 3, 10, 1),
+    ]
+    analyzer = ChangeAnalyzer()
+    results = []
+    for files, diff, n_files, added, deleted in cases:
+        stats = {"files": n_files, "added": added, "deleted": deleted}
+        results.append(analyzer.classify_change_type(files, diff, stats))
+    monkeypatch.setattr(ChangeAnalyzer, "_KEYWORD_AUTOMATON", None)
+    for (files, diff, n_files, added, deleted), expected in zip(cases, results):
+        stats = {"files": n_files, "added": added, "deleted": deleted}
+        assert analyzer.classify_change_type(files, diff, stats) == expected
+    assert results == ["docs", "style", "docs"]
+
+
+def test_per_file_notes_batch_ignores_diff_prefix_config():
+    """diff.noprefix / diff.mnemonicPrefix and quoted names still get notes."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_dir)
+            _git("init", "-q")
+            _git("config", "diff.noprefix", "true")
+            _git("config", "diff.mnemonicPrefix", "true")
+            Path("c.py").write_text("def bar():\n    return 2\n")
+            Path('q"x.py').write_text("def baz():\n    return 3\n")
+            _git("add", "-A")
+
+            batch = ContentAnalyzer().per_file_notes_batch(["c.py", 'q"x.py'])
+            assert batch == {
+                "c.py": ["add functions: bar"],
+                'q"x.py': ["add functions: baz"],
+            }
+        finally:
+            os.chdir(old_cwd)
@@ -0,0 +1,42 @@
+"""Tests for goal/generator/generator.py."""
+
+import builtins
+from unittest import mock
+
+from goal.generator.generator import CommitMessageGenerator
+
+
+def test_enhanced_generator_import_failure_is_not_retried():
+    """A missing summary package is probed once per generator."""
+    real_import = builtins.__import__
+    attempts = []
+
+    def fake_import(name, *args, **kwargs):
+        if name == "goal.summary":
+            attempts.append(name)
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    generator = CommitMessageGenerator(config={})
+    with mock.patch("builtins.__import__", side_effect=fake_import):
+        assert generator.enhanced_generator is None
+        assert generator.enhanced_generator is None
+    assert attempts == ["goal.summary"]
+
+
+def test_precomputed_intent_is_ignored_for_a_different_diff():
+    """A stored intent/scope only applies to the diff it was computed on."""
+    generator = CommitMessageGenerator(config={})
+    generator.cache[generator._precomputed_key(True, None, "old diff")] = {
+        "change_type": "perf",
+        "scope": "stale",
+    }
+    with mock.patch.multiple(
+        generator,
+        _prime_caches=mock.DEFAULT,
+        get_changed_files=mock.Mock(return_value=["README.md"]),
+        get_diff_content=mock.Mock(return_value="+new docs line\n"),
+        get_diff_stats=mock.Mock(return_value={"files": 1, "added": 1, "deleted": 0}),
+    ):
+        message = generator.generate_commit_message(abstraction_level="legacy")
+    assert message.startswith("docs")
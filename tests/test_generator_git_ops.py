@@ -0,0 +1,99 @@
+"""Tests for goal/generator/git_ops.py."""
+
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from goal.generator.git_ops import (
+    GitDiffOperations,
+    _parse_raw_numstat,
+    _sum_numstat,
+)
+
+
+def _git(*args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+def _init_repo_with_staged_change():
+    _git("init", "-q")
+    Path("a.txt").write_text("a\n")
+    _git("add", ".")
+    _git("commit", "-qm", "init")
+    Path("a.txt").write_text("a\nb\n")
+    Path("new.py").write_text("x = 1\n")
+    _git("add", "-A")
+
+
+def test_parse_raw_numstat_handles_renames_and_binary():
+    """Raw and numstat records are parsed from one NUL-separated stream."""
+    output = (
+        ":100644 100644 aaa bbb M\0a.txt\0"
+        ":100644 100644 ccc ccc R100\0b c.txt\0d.txt\0"
+        ":000000 100644 000 eee A\0img.png\0"
+        "1\t0\ta.txt\0"
+        "0\t0\t\0b c.txt\0d.txt\0"
+        "-\t-\timg.png\0"
+    )
+    name_status, numstat = _parse_raw_numstat(output)
+    assert name_status == [("M", "a.txt"), ("R100", "d.txt"), ("A", "img.png")]
+    assert numstat == {"a.txt": (1, 0), "d.txt": (0, 0), "img.png": (0, 0)}
+
+
+def test_sum_numstat_skips_binary_counts():
+    """Binary ``-`` counts add a file but no lines; tabs in paths are kept."""
+    output = b"10\t5\tfile.py\n-\t-\timg.png\n3\t0\tweird\tname.txt\n"
+    assert _sum_numstat(output) == {"files": 3, "added": 13, "deleted": 5}
+    assert _sum_numstat(b"") == {"files": 0, "added": 0, "deleted": 0}
+
+
+def test_prime_caches_populates_all_views():
+    """One priming call fills name-status, numstat, files and stats caches."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_dir)
+            _init_repo_with_staged_change()
+
+            ops = GitDiffOperations(disk_cache=False)
+            ops.prime_caches(cached=True)
+
+            assert ops.cache["name_status_True_*"] == [("M", "a.txt"), ("A", "new.py")]
+            assert ops.get_numstat_map() == {"a.txt": (1, 0), "new.py": (1, 0)}
+            assert ops.get_changed_files() == ["a.txt", "new.py"]
+            assert ops.get_diff_stats() == {"files": 2, "added": 2, "deleted": 0}
+        finally:
+            os.chdir(old_cwd)
+
+
+def test_disk_cache_survives_new_instance_until_index_changes():
+    """Staged-diff results are reused from .git/goal-cache across instances."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_dir)
+            _init_repo_with_staged_change()
+            first = GitDiffOperations()
+            assert first.get_numstat_map() == {"a.txt": (1, 0), "new.py": (1, 0)}
+            assert list(Path(".git", "goal-cache").iterdir())
+
+            real_run = subprocess.run
+            with mock.patch(
+                "goal.generator.git_ops.subprocess.run", side_effect=real_run
+            ) as spy:
+                second = GitDiffOperations()
+                assert second.get_numstat_map() == first.get_numstat_map()
+            assert not any("diff" in c.args[0] for c in spy.call_args_list)
+
+            Path("new.py").write_text("x = 1\ny = 2\n")
+            _git("add", "new.py")
+            third = GitDiffOperations()
+            assert third.get_numstat_map()["new.py"] == (2, 0)
+        finally:
+            os.chdir(old_cwd)
@@ -1,19 +1,26 @@
 """Tests for goal/git_ops.py."""
 
+import subprocess
 import tempfile
 from pathlib import Path
 from unittest import mock
 
 
 from goal.git_ops import (
+    gather_push_snapshot,
     is_git_repository,
     validate_repo_url,
     get_staged_files,
     get_unstaged_files,
+    get_working_tree_files,
     get_diff_stats,
     get_diff_content,
+    get_diff_snapshot,
     apply_ticket_prefix,
     read_ticket,
+    run_command,
+    run_command_tee,
+    run_git,
 )
 
 
@@ -78,6 +85,24 @@ def test_read_ticket_file_exists():
             os.chdir(old_cwd)
 
 
+def test_apply_ticket_prefix_follows_ticket_file_edits():
+    """Memoized formatting still picks up a changed TICKET file."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        import os
+
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_dir)
+            assert apply_ticket_prefix("fix: x", None) == "fix: x"
+            Path("TICKET").write_text("prefix=ABC-1\n")
+            assert apply_ticket_prefix("fix: x", None) == "[ABC-1] fix: x"
+            Path("TICKET").write_text("prefix=ABC-22\nformat={ticket}: {title}\n")
+            assert apply_ticket_prefix("fix: x", None) == "ABC-22: fix: x"
+            assert apply_ticket_prefix("fix: x", "CLI-9") == "CLI-9: fix: x"
+        finally:
+            os.chdir(old_cwd)
+
+
 def test_get_diff_stats_empty():
     """Test diff stats with no changes."""
     with mock.patch("goal.git_ops.run_git") as mock_run:
@@ -145,12 +170,20 @@ def test_get_unstaged_files():
     """Test getting unstaged files."""
     with mock.patch("goal.git_ops.run_git") as mock_run:
         mock_run.return_value = mock.Mock(
-            stdout=" M file1.py\n?? file2.py\n", returncode=0
+            stdout=" M file1.py\0?? file2.py\0R  new name.py\0old.py\0",
+            returncode=0,
         )
         result = get_unstaged_files()
-        # Note: status --porcelain format, first 2 chars are status, then space
-        assert "ile1.py" in result  # ' M ' + 'file1.py' -> sliced at 3 gives 'ile1.py'
-        assert "file2.py" in result
+        # status --porcelain -z: "XY path" records; renames carry the source next
+        assert result == ["file1.py", "file2.py", "new name.py"]
+        assert mock_run.call_args.args == ("status", "--porcelain", "-z")
+
+
+def test_get_unstaged_files_clean_tree():
+    """A clean tree yields no entries (not a single empty path)."""
+    with mock.patch("goal.git_ops.run_git") as mock_run:
+        mock_run.return_value = mock.Mock(stdout="", returncode=0)
+        assert get_unstaged_files() == []
 
 
 def test_is_git_repository_true():
@@ -180,3 +213,159 @@ def test_is_git_repository_false():
                 assert not is_git_repository()
         finally:
             os.chdir(old_cwd)
+
+
+def test_run_git_reuses_staged_queries_until_index_changes():
+    """Read-only staged queries are memoized until the index is rewritten."""
+    import os
+    import subprocess
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_dir)
+            subprocess.run(["git", "init", "-q"], check=True)
+            Path("a.txt").write_text("a\n")
+            assert get_staged_files() == []
+
+            real_run = subprocess.run
+            with mock.patch("goal.git_ops.subprocess.run", side_effect=real_run) as spy:
+                assert get_staged_files() == []
+            assert spy.call_count == 0
+
+            subprocess.run(["git", "add", "a.txt"], check=True)
+            assert get_staged_files() == ["a.txt"]
+        finally:
+            os.chdir(old_cwd)
+
+
+def test_run_git_decode_false_returns_bytes():
+    """``decode=False`` yields raw stdout, memoized apart from the text form."""
+    import os
+    import subprocess
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_dir)
+            subprocess.run(["git", "init", "-q"], check=True)
+            Path("a.txt").write_text("a\n")
+            subprocess.run(["git", "add", "a.txt"], check=True)
+            raw = run_git("diff", "--cached", "--name-only", decode=False)
+            assert raw.stdout == b"a.txt\n"
+            text = run_git("diff", "--cached", "--name-only")
+            assert text.stdout == "a.txt\n"
+        finally:
+            os.chdir(old_cwd)
+
+
+def test_get_working_tree_files_from_single_status_call():
+    """Unstaged and untracked paths come from one porcelain status call."""
+    import os
+    import subprocess
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_dir)
+            git = ["git", "-c", "user.name=t", "-c", "user.email=t@t"]
+            subprocess.run(["git", "init", "-q"], check=True)
+            Path("tracked.txt").write_text("one\n")
+            Path("staged.txt").write_text("one\n")
+            subprocess.run([*git, "add", "."], check=True)
+            subprocess.run([*git, "commit", "-qm", "init"], check=True)
+
+            Path("tracked.txt").write_text("two\n")
+            Path("staged.txt").write_text("two\n")
+            subprocess.run(["git", "add", "staged.txt"], check=True)
+            Path("sub").mkdir()
+            Path("sub", "new file.txt").write_text("x\n")
+
+            real_run = subprocess.run
+            with mock.patch(
+                "goal.git_ops.subprocess.run", side_effect=real_run
+            ) as spy, mock.patch("goal.git_ops.HAS_POSIX_SPAWN", False):
+                files = get_working_tree_files()
+            assert files == ["tracked.txt", "sub/new file.txt"]
+            assert spy.call_count == 1
+        finally:
+            os.chdir(old_cwd)
+
+
+def test_get_diff_snapshot_parses_nul_numstat_with_renames():
+    """Files and stats come from one numstat call; renames use the new path."""
+    with mock.patch("goal.git_ops.run_git") as mock_run:
+        mock_run.return_value = mock.Mock(
+            stdout="3\t1\ta.py\0" "0\t0\t\0old.py\0new.py\0" "-\t-\timg.png\0",
+            returncode=0,
+        )
+        snapshot = get_diff_snapshot()
+    assert snapshot.files == ["a.py", "new.py", "img.png"]
+    assert snapshot.stats["new.py"] == (0, 0)
+    assert (snapshot.lines_added, snapshot.lines_deleted) == (3, 1)
+
+
+def test_run_command_argv_skips_the_shell():
+    """Argv commands run without a shell; strings still get one."""
+    with mock.patch("goal.git_ops.subprocess.run", wraps=subprocess.run) as spy:
+        result = run_command(["printf", "%s", "a b;c"])
+        assert spy.call_args.kwargs["shell"] is False
+    assert result.stdout == "a b;c"
+    assert run_command("printf '%s' $((1 + 1))").stdout == "2"
+    assert run_command_tee(["printf", "%s", "*"]).stdout == "*"
+
+
+def test_run_command_tee_translates_newlines_like_run_command():
+    """Captured tee output gets the same universal-newline translation."""
+    command = ["printf", "a\\r\\nb\\rc\\n"]
+    assert run_command_tee(command).stdout == "a\nb\nc\n"
+    assert run_command_tee(command).stdout == run_command(command).stdout
+
+
+def test_tag_verify_sees_tag_created_in_same_process():
+    """rev-parse of a tag is not served stale after ``git tag``."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        import os
+
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_dir)
+            git = ["git", "-c", "user.name=t", "-c", "user.email=t@t"]
+            subprocess.run([*git, "init", "-q"], check=True)
+            subprocess.run(
+                [*git, "commit", "-q", "--allow-empty", "-m", "init"], check=True
+            )
+            verify = ("rev-parse", "-q", "--verify", "refs/tags/v1")
+            assert run_git(*verify).returncode == 1
+            assert run_git("tag", "v1").returncode == 0
+            assert run_git(*verify).returncode == 0
+
+            # A tag made behind goal's back is seen as well.
+            subprocess.run(["git", "tag", "v2"], check=True)
+            verify_v2 = ("rev-parse", "-q", "--verify", "refs/tags/v2")
+            assert run_git(*verify_v2).returncode == 0
+        finally:
+            os.chdir(old_cwd)
+
+
+def test_gather_push_snapshot_reads_files_stats_and_branch():
+    """Staged files, numstat and branch come from one concurrent batch."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        import os
+
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_dir)
+            git = ["git", "-c", "user.name=t", "-c", "user.email=t@t"]
+            subprocess.run([*git, "init", "-q", "-b", "trunk"], check=True)
+            subprocess.run(
+                [*git, "commit", "-q", "--allow-empty", "-m", "init"], check=True
+            )
+            Path("a.py").write_text("x = 1\ny = 2\n")
+            subprocess.run(["git", "add", "a.py"], check=True)
+            context = gather_push_snapshot()
+            assert context.files == ["a.py"]
+            assert context.stats == {"a.py": (2, 0)}
+            assert context.branch == "trunk"
+        finally:
+            os.chdir(old_cwd)
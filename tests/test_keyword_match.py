@@ -0,0 +1,26 @@
+"""Tests for goal/keyword_match.py."""
+
+from goal.keyword_match import (
+    HAS_AHOCORASICK,
+    build_keyword_automaton,
+    split_literal_patterns,
+)
+
+
+def test_split_literal_patterns_separates_plain_keywords():
+    """Escaped dots count as literals; anything else stays a regex."""
+    literals, regexes = split_literal_patterns(
+        {"feat": [r"src/", r"\.py$", r"setup\.cfg"], "docs": [r"README"]}
+    )
+    assert literals == {"feat": ["src/", "setup.cfg"], "docs": ["README"]}
+    assert regexes == {"feat": [r"\.py$"]}
+
+
+def test_build_keyword_automaton_merges_types_per_keyword():
+    """A keyword shared by several types reports all of them."""
+    automaton = build_keyword_automaton({"fix": ["bug"], "test": ["bug", "pytest"]})
+    if not HAS_AHOCORASICK:
+        assert automaton is None
+        return
+    hits = {value for _, value in automaton.iter("bug in pytest")}
+    assert hits == {("bug", ("fix", "test")), ("pytest", ("test",))}
@@ -195,6 +195,23 @@ class TestDiagnosePython:
         assert '{name = "Tom Sapletta", email = "tom@sapletta.com"}' in content
         assert '<tom@sapletta.com>"' not in content  # old string format removed
 
+    def test_stale_dist_files(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "my.pkg"\n')
+        dist = tmp_path / "dist"
+        (dist / "subdir").mkdir(parents=True)
+        (dist / "my-pkg-0.1.0.tar.gz").write_text("")
+        (dist / "My_Pkg-0.1.0-py3-none-any.whl").write_text("")
+        (dist / "other-1.0.0.tar.gz").write_text("")
+        issues = _diagnose_python(tmp_path, auto_fix=True)
+        py012 = [i for i in issues if i.code == "PY012"]
+        assert len(py012) == 1
+        assert "other-1.0.0.tar.gz" in py012[0].detail
+        assert sorted(p.name for p in dist.iterdir()) == [
+            "My_Pkg-0.1.0-py3-none-any.whl",
+            "my-pkg-0.1.0.tar.gz",
+            "subdir",
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Node.js diagnostics
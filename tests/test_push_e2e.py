@@ -10,6 +10,8 @@ import pytest
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from goal.git_ops import PushSnapshot  # noqa: E402
+
 
 class TestPublishRetry:
     """Tests for 429 rate-limit retry logic in _run_publish_command."""
@@ -84,6 +86,18 @@ class TestPublishRetry:
         assert result is False
         mock_sleep.assert_not_called()
 
+    def test_existing_artifact_is_not_a_failure(self):
+        """An already-uploaded file is skipped, whatever the casing."""
+        from goal.cli.publish import _run_publish_command
+
+        for stderr in (
+            "HTTPError: 400 Bad Request\nFile already exists. See https://pypi.org",
+            "error: file  already-exists on the index",
+        ):
+            result = MagicMock(returncode=1, stdout="", stderr=stderr)
+            with patch("goal.cli.publish.run_command_tee", return_value=result):
+                assert _run_publish_command("python", "twine upload dist/*") is True
+
     def test_is_rate_limited_detection(self):
         """Test that _is_rate_limited correctly identifies 429 responses."""
         from goal.cli.publish import _is_rate_limited
@@ -99,6 +113,108 @@ class TestPublishRetry:
         assert _is_rate_limited(not_limited) is False
 
 
+class TestPublishDeps:
+    """Tests for the build/twine availability check."""
+
+    def test_probes_modules_once_and_installs_only_missing(self):
+        """One probe subprocess per interpreter; only missing modules install."""
+        from goal.cli import publish
+
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return MagicMock(returncode=0, stdout="twine\n", stderr="")
+
+        with (
+            patch("goal.cli.publish.subprocess.run", side_effect=fake_run),
+            patch.object(publish, "_publish_ready", set()),
+        ):
+            assert publish._ensure_publish_deps("/venv/python") is True
+            assert publish._ensure_publish_deps("/venv/python") is True
+
+        assert len(calls) == 2
+        assert calls[0][:2] == ["/venv/python", "-c"]
+        assert calls[0][-2:] == ["build", "twine"]
+        assert calls[1] == ["/venv/python", "-m", "pip", "install", "--quiet", "twine"]
+
+    def test_leftover_build_dir_does_not_count_as_installed(
+        self, tmp_path, monkeypatch
+    ):
+        """A stray ``build/`` tree in the project is not the build module."""
+        from goal.cli.publish import _missing_modules
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "build" / "lib").mkdir(parents=True)
+        (tmp_path / "goal_probe_pkg").mkdir()
+        assert _missing_modules(sys.executable, ["goal_probe_pkg", "json"]) == [
+            "goal_probe_pkg"
+        ]
+        installed = (
+            subprocess.run(
+                [sys.executable, "-m", "build", "--help"],
+                cwd=tmp_path,
+                capture_output=True,
+            ).returncode
+            == 0
+        )
+        assert ("build" in _missing_modules(sys.executable, ["build"])) is not installed
+
+
+class TestMakefileTarget:
+    """Tests for makefile_has_target."""
+
+    def test_detects_target_only_in_regular_makefile(self, tmp_path, monkeypatch):
+        from goal.cli.publish import makefile_has_target
+
+        monkeypatch.chdir(tmp_path)
+        assert makefile_has_target("publish") is False
+        (tmp_path / "Makefile").mkdir()
+        assert makefile_has_target("publish") is False
+        (tmp_path / "Makefile").rmdir()
+        (tmp_path / "Makefile").write_text("build:\n\ttrue\npublish: build\n")
+        assert makefile_has_target("publish") is True
+        assert makefile_has_target("deploy") is False
+
+
+class TestConfigDict:
+    """Tests for the shared per-run config dict."""
+
+    def test_to_dict_runs_once_per_config_object(self):
+        from goal.push.stages.commit import get_config_dict
+
+        config = MagicMock()
+        config.to_dict.return_value = {"quality": {}}
+        ctx_obj = {"config": config}
+
+        assert get_config_dict(ctx_obj) is get_config_dict(ctx_obj)
+        config.to_dict.assert_called_once()
+
+        ctx_obj["config"] = other = MagicMock()
+        other.to_dict.return_value = {"git": {}}
+        assert get_config_dict(ctx_obj) == {"git": {}}
+        assert get_config_dict({}) is None
+
+    def test_commit_message_generates_detailed_once(self):
+        from goal.push.stages.commit import get_commit_message
+
+        config = MagicMock()
+        config.to_dict.return_value = {
+            "quality": {"enhanced_summary": {"enabled": True}}
+        }
+        detailed = {"title": "feat: x", "body": "b"}
+        with patch("goal.push.stages.commit.CommitMessageGenerator") as generator_cls:
+            generator = generator_cls.return_value
+            generator.generate_detailed_message.return_value = detailed
+            generator.generate_abstraction_message.return_value = None
+            result = get_commit_message(
+                {"config": config}, ["x.py"], "", None, None, "auto"
+            )
+
+        assert result == ("feat: x", "b", detailed)
+        generator.generate_detailed_message.assert_called_once()
+
+
 class TestWorkflowOrder:
     """Tests that publish happens before tag+push in the workflow."""
 
@@ -129,10 +245,11 @@ class TestWorkflowOrder:
                 "goal.push.core._detect_and_bootstrap_projects", return_value=["python"]
             ),
             patch("goal.push.core.run_git"),
-            patch("goal.push.core.get_staged_files", return_value=["test.txt"]),
+            patch(
+                "goal.push.core.gather_push_snapshot",
+                return_value=PushSnapshot(["test.txt"], {"test.txt": (1, 0)}, "main"),
+            ),
             patch("goal.push.core._validate_staged_files"),
-            patch("goal.push.core.get_diff_content", return_value="diff"),
-            patch("goal.push.core.get_diff_stats", return_value={"test.txt": (1, 0)}),
             patch(
                 "goal.push.core.get_commit_message",
                 return_value=("feat: test", None, {}),
@@ -142,7 +259,6 @@ class TestWorkflowOrder:
             patch("goal.push.core._handle_commit_phase", side_effect=track("commit")),
             patch("goal.push.core.handle_publish", side_effect=track("publish", True)),
             patch("goal.push.core.create_tag", side_effect=track("tag", "v0.1.1")),
-            patch("goal.git_ops.get_remote_branch", return_value="main"),
             patch("goal.push.core.push_to_remote", side_effect=track("push")),
             patch("goal.push.core.handle_todo_stage"),
             patch("goal.push.core.output_final_summary"),
@@ -422,10 +538,11 @@ class TestPushWorkflowE2E:
                 "goal.push.core._detect_and_bootstrap_projects", return_value=["python"]
             ),
             patch("goal.push.core.run_git"),
-            patch("goal.push.core.get_staged_files", return_value=["test.txt"]),
+            patch(
+                "goal.push.core.gather_push_snapshot",
+                return_value=PushSnapshot(["test.txt"], {"test.txt": (1, 0)}, "main"),
+            ),
             patch("goal.push.core._validate_staged_files"),
-            patch("goal.push.core.get_diff_content", return_value="diff"),
-            patch("goal.push.core.get_diff_stats", return_value={"test.txt": (1, 0)}),
             patch(
                 "goal.push.core.get_commit_message",
                 return_value=("feat: test", None, {}),
@@ -473,8 +590,11 @@ class TestPushWorkflowE2E:
         }
 
         with (
-            patch("goal.push.core.handle_version_sync") as mock_version_sync,
-            patch("goal.push.core.handle_changelog") as mock_changelog,
+            patch(
+                "goal.push.core.write_release_files",
+                return_value=["pyproject.toml", "CHANGELOG.md"],
+            ) as mock_release_files,
+            patch("goal.push.core.stage_paths") as mock_stage_paths,
             patch(
                 "goal.push.core._update_cost_badges", return_value=True
             ) as mock_update_badges,
@@ -496,16 +616,111 @@ class TestPushWorkflowE2E:
                 no_changelog=False,
             )
 
-        mock_version_sync.assert_called_once_with("1.2.4", False, {}, True)
-        mock_changelog.assert_called_once_with(
-            "1.2.4", ["src/app.py"], "feat: add thing", None, False
+        mock_release_files.assert_called_once_with(
+            "1.2.4", ["src/app.py"], "feat: add thing", None, {}, False, False
         )
+        mock_stage_paths.assert_called_once_with(["pyproject.toml", "CHANGELOG.md"])
         mock_update_badges.assert_called_once_with(ctx_obj, "1.2.4")
         mock_run_git_local.assert_called_once_with("add", "README.md")
         mock_single_commit.assert_called_once_with(
             "feat: add thing", None, "feat: add thing", None, True
         )
 
+    def test_write_release_files_returns_every_path_to_stage(
+        self, tmp_path, monkeypatch
+    ):
+        """Version files and the changelog come back as one list to stage."""
+        from goal.push.stages.version import write_release_files
+
+        with (
+            patch(
+                "goal.push.stages.version.sync_all_versions_wrapper",
+                return_value=["pyproject.toml"],
+            ) as mock_sync,
+            patch("goal.push.stages.version.update_changelog_stage") as mock_changelog,
+        ):
+            updated = write_release_files(
+                "1.2.4", ["src/app.py"], "feat: x", None, {}, False, False
+            )
+
+        assert updated == ["pyproject.toml", "CHANGELOG.md"]
+        mock_sync.assert_called_once_with("1.2.4", {})
+        mock_changelog.assert_called_once_with("1.2.4", ["src/app.py"], "feat: x", None)
+
+        monkeypatch.chdir(tmp_path)
+        updated = write_release_files("2.0.0", [], "", None, {}, True, True)
+        assert updated == ["VERSION"]
+        assert (tmp_path / "VERSION").read_text() == "2.0.0\n"
+
+    def test_push_to_remote_sends_branch_and_tag_atomically(
+        self, tmp_path, monkeypatch
+    ):
+        """Branch and tag go out together; a rejected tag still pushes the branch."""
+        from goal.git_ops import run_git_with_status
+        from goal.push.stages.push_remote import push_to_remote
+
+        git = ["git", "-c", "user.name=t", "-c", "user.email=t@t"]
+        remote = tmp_path / "remote.git"
+        subprocess.run(["git", "init", "-q", "--bare", str(remote)], check=True)
+        work = tmp_path / "work"
+        subprocess.run([*git, "init", "-q", "-b", "main", str(work)], check=True)
+        monkeypatch.chdir(work)
+        subprocess.run(["git", "remote", "add", "origin", str(remote)], check=True)
+        subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "a"], check=True)
+        subprocess.run([*git, "tag", "v1"], check=True)
+
+        with patch(
+            "goal.push.stages.push_remote.run_git_with_status",
+            wraps=run_git_with_status,
+        ) as spy:
+            assert push_to_remote("main", "v1", False, True)
+        assert spy.call_count == 1
+        assert "--atomic" in spy.call_args.args
+
+        def remote_ref(ref):
+            return subprocess.run(
+                ["git", "--git-dir", str(remote), "rev-parse", "-q", "--verify", ref],
+                capture_output=True,
+                text=True,
+            ).stdout.strip()
+
+        assert remote_ref("v1") == remote_ref("main")
+
+        subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "b"], check=True)
+        subprocess.run([*git, "tag", "-f", "v1"], check=True, capture_output=True)
+        assert push_to_remote("main", "v1", False, True)
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True
+        ).stdout.strip()
+        assert remote_ref("main") == head
+        assert remote_ref("v1") != head
+
+        # A non-fast-forward rejection has nothing to do with the tag: no retry.
+        other = tmp_path / "other"
+        subprocess.run(
+            ["git", "clone", "-q", "-b", "main", str(remote), str(other)],
+            check=True,
+            capture_output=True,
+        )
+        subprocess.run(
+            [*git, "-C", str(other), "commit", "-q", "--allow-empty", "-m", "c"],
+            check=True,
+        )
+        subprocess.run(
+            ["git", "-C", str(other), "push", "-q", "origin", "main"],
+            check=True,
+            capture_output=True,
+        )
+        subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "d"], check=True)
+        subprocess.run([*git, "tag", "v2"], check=True)
+        with patch(
+            "goal.push.stages.push_remote.run_git_with_status",
+            wraps=run_git_with_status,
+        ) as spy:
+            assert not push_to_remote("main", "v2", False, True)
+        assert spy.call_count == 1
+        assert remote_ref("v2") == ""
+
     def test_publish_project_skips_nodejs_publish_when_not_configured(self):
         """Test that local Node.js packages without nodejs project config are not published."""
         from goal.cli.publish import publish_project
@@ -590,7 +805,7 @@ class TestPushWorkflowE2E:
         mock_detect.assert_called_once()
         mock_which.assert_called_once_with("make")
         mock_has_target.assert_called_once_with("publish")
-        mock_run_command.assert_called_once_with("make publish")
+        mock_run_command.assert_called_once_with(["make", "publish"])
         mock_version.assert_called_once_with()
         mock_publish_project.assert_called_once_with(
             ["python"], "1.2.3", False, config=None
@@ -2,7 +2,12 @@ import os
 import pytest
 from goal.cli import sync_all_versions
 from goal.cli.version import PROJECT_TYPES
-from goal.cli.version_utils import bump_version
+from goal.cli.version_utils import (
+    bump_version,
+    detect_project_types,
+    get_version_from_file,
+    update_version_in_file,
+)
 
 
 def test_sync_updates_init_py(tmp_path):
@@ -98,3 +103,99 @@ def test_python_publish_command_skips_existing():
 def test_bump_version_pre_release_formats(version, bump_type, expected):
     """bump_version must not crash on pre-release suffixes and must strip them."""
     assert bump_version(version, bump_type) == expected
+
+
+def test_version_patterns_read_and_update_files(tmp_path):
+    """PROJECT_TYPES patterns find and bump versions via the compiled regexes."""
+    pattern = PROJECT_TYPES["rust"]["version_patterns"]["Cargo.toml"]
+    cargo = tmp_path / "Cargo.toml"
+    cargo.write_text('[package]\nname = "x"\nversion = "1.4.2"\n')
+
+    assert get_version_from_file(cargo, pattern) == "1.4.2"
+    assert update_version_in_file(cargo, pattern, "1.4.2", "1.5.0")
+    assert get_version_from_file(cargo, pattern) == "1.5.0"
+    assert not update_version_in_file(cargo, pattern, "1.4.2", "1.6.0")
+
+
+def test_get_version_from_json_reads_top_level_version(tmp_path):
+    """package.json is parsed as JSON; nested "version" keys are ignored."""
+    pattern = PROJECT_TYPES["nodejs"]["version_patterns"]["package.json"]
+    package = tmp_path / "package.json"
+    package.write_text(
+        '{"name": "x", "engines": {"version": "9.9.9"}, "version": "2.0.1"}\n'
+    )
+    assert get_version_from_file(package, pattern) == "2.0.1"
+
+    package.write_text('{"name": "x", "config": {"version": "9.9.9"}}\n')
+    assert get_version_from_file(package, pattern) is None
+
+
+def test_detect_project_types_cached_until_directory_changes(tmp_path, monkeypatch):
+    """Detection is memoized per directory and refreshed when entries change."""
+    monkeypatch.chdir(tmp_path)
+    assert detect_project_types() == []
+
+    (tmp_path / "Cargo.toml").write_text('[package]\nversion = "0.1.0"\n')
+    os.utime(tmp_path, ns=(0, os.stat(tmp_path).st_mtime_ns + 1))
+    assert detect_project_types() == ["rust"]
+
+    result = detect_project_types()
+    result.append("mutated")
+    assert detect_project_types() == ["rust"]
+
+
+def test_sync_all_versions_is_idempotent(tmp_path, monkeypatch):
+    """A second sync to the same version leaves files untouched."""
+    monkeypatch.chdir(tmp_path)
+    package = tmp_path / "package.json"
+    package.write_text('{"name": "x", "version": "1.0.0"}')
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text('__version__ = "1.0.0"\n')
+
+    assert sync_all_versions("1.1.0") == [
+        "VERSION",
+        "package.json",
+        os.path.join("pkg", "__init__.py"),
+    ]
+    stamps = {p: p.stat().st_mtime_ns for p in tmp_path.rglob("*") if p.is_file()}
+
+    assert sync_all_versions("1.1.0") == ["VERSION"]
+    assert {p: p.stat().st_mtime_ns for p in stamps} == stamps
+
+
+def test_read_text_cached_reuses_settled_files(tmp_path):
+    """Settled files are read once; a rewrite (new mtime/size) is picked up."""
+    from goal.cli.version_utils import _read_text_cached
+
+    path = tmp_path / "pyproject.toml"
+    path.write_text('version = "1.0.0"\n')
+    old = os.stat(path).st_mtime_ns - 10_000_000_000
+    os.utime(path, ns=(old, old))
+
+    assert _read_text_cached(path) == 'version = "1.0.0"\n'
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(type(path), "read_text", lambda self: "unexpected")
+        assert _read_text_cached(path) == 'version = "1.0.0"\n'
+
+    path.write_text('version = "1.10.0"\n')
+    assert _read_text_cached(path) == 'version = "1.10.0"\n'
+
+
+def test_read_pyproject_parses_identical_content_once(tmp_path):
+    """Unchanged pyproject text is parsed once; a rewrite or bad TOML is not."""
+    from goal.toml_validation import parse_toml, read_pyproject
+
+    path = tmp_path / "pyproject.toml"
+    path.write_text('[project]\nname = "pkg"\n')
+
+    first = read_pyproject(tmp_path)
+    assert first == {"project": {"name": "pkg"}}
+    assert read_pyproject(tmp_path) is first
+    assert parse_toml('[project]\nname = "pkg"\n') is first
+
+    path.write_text('[project]\nname = "other"\n')
+    assert read_pyproject(tmp_path) == {"project": {"name": "other"}}
+    path.write_text("[project\n")
+    assert read_pyproject(tmp_path) is None
+    assert read_pyproject(tmp_path / "missing") is None